@@ -533,6 +533,9 @@ class BaseEntity(ABC, metaclass=EntityMeta):
         internal_attrs = {"name", "isactive", "_use_cache", "_cached_to_dict", "_container"}
         if key in internal_attrs or key.startswith('_'):
             super().__setattr__(key, value)
+            if key in ("name", "isactive"):
+                # Both are serialized by to_dict, so a cached dict is stale after they change
+                self._invalidate_cache()
         elif key in self._fields:
             expected_type = self._resolve_type(self._fields[key])
             self._validate_type(key, value, expected_type)
@@ -1,8 +1,100 @@
 from abc import ABC
-from typing import Dict, Any, Optional, Callable, List, Type
+from typing import Dict, Any, Optional, Callable, List, Type, Tuple
 from common.utils.logging_setup import logger
-from functools import lru_cache
-import inspect
+import logging
+from weakref import WeakKeyDictionary
+
+_EXCLUDED_METHOD_NAMES = frozenset(('__getattribute__', '__setattr__'))
+
+def _collect_public_methods(obj: Any, skip_prefix: str = '_') -> Dict[str, Callable]:
+    """Collect callable attributes of an object or class with a single `dir()` walk.
+
+    Args:
+        obj (Any): The instance or class to scan.
+        skip_prefix (str): Names starting with this prefix are skipped. Defaults to '_'.
+
+    Returns:
+        Dict[str, Callable]: Dictionary mapping method names to callables.
+    """
+    methods = {}
+    set_method = methods.__setitem__
+    for name in dir(obj):
+        if name.startswith(skip_prefix) or name in _EXCLUDED_METHOD_NAMES:
+            continue
+        attr = getattr(obj, name, None)
+        if callable(attr) and not isinstance(attr, (type, property)):
+            set_method(name, attr)
+    return methods
+
+_CLASS_METHOD_CACHE: "WeakKeyDictionary[type, Dict[str, Callable]]" = WeakKeyDictionary()
+_BUILTIN_METHODS: Dict[type, Dict[str, Callable]] = {
+    cls: _collect_public_methods(cls) for cls in (list, dict, set, tuple, frozenset)
+}
+
+def _methods_for_class(cls: type) -> Dict[str, Callable]:
+    """Retrieve the public methods of a class, scanning it only once.
+
+    Args:
+        cls (type): The class to query.
+
+    Returns:
+        Dict[str, Callable]: Cached dictionary mapping method names to callables.
+    """
+    methods = _BUILTIN_METHODS.get(cls)
+    if methods is not None:
+        return methods
+    methods = _CLASS_METHOD_CACHE.get(cls)
+    if methods is None:
+        methods = _CLASS_METHOD_CACHE[cls] = _collect_public_methods(cls)
+    return methods
+
+_OPERATION_METHOD_NAMES: "WeakKeyDictionary[type, Tuple[str, ...]]" = WeakKeyDictionary()
+
+def _operation_methods(instance: Any) -> Dict[str, Callable]:
+    """Retrieve the methods of a super-instance, scanning its class only once.
+
+    Args:
+        instance (Any): The super-instance registered as an operation handler.
+
+    Returns:
+        Dict[str, Callable]: Dictionary mapping method names to methods bound to the instance.
+    """
+    cls = type(instance)
+    names = _OPERATION_METHOD_NAMES.get(cls)
+    if names is None:
+        names = _OPERATION_METHOD_NAMES[cls] = tuple(_collect_public_methods(cls, skip_prefix='__'))
+    return {name: getattr(instance, name) for name in names}
+
+_FIELD_VALIDATORS = (
+    ("method", (str, type(None)), "str or None"),
+    ("attributes", (dict, type(None)), "dict or None"),
+)
+
+def _validate_fields(request: Dict[str, Any]) -> Optional[str]:
+    """Check the optional fields of a single request against their expected types.
+
+    Args:
+        request (Dict[str, Any]): The request dictionary to check.
+
+    Returns:
+        Optional[str]: Error message for the first invalid field, or None if all fields are valid.
+    """
+    for field, expected_types, expected_name in _FIELD_VALIDATORS:
+        if field in request and not isinstance(request[field], expected_types):
+            return f"Invalid '{field}' type: expected {expected_name}, got {type(request[field]).__name__}"
+    return None
+
+def _error(obj: Any, error: str) -> Dict[str, Any]:
+    """Build the standard error result dictionary.
+
+    Args:
+        obj (Any): The object associated with the failed request.
+        error (str): The error message.
+
+    Returns:
+        Dict[str, Any]: Dictionary with status=False and the error message.
+    """
+    return {"status": False, "object": obj, "method": None, "result": None, "error": error}
 
 class Manipulator(ABC):
     """Abstract class for managing and processing operations on objects.
@@ -14,11 +106,13 @@ class Manipulator(ABC):
     Attributes:
         _managing_object (Optional[Any]): The central object being managed.
         _base_classes (List[Type]): List of base classes whose methods are registered.
+        _base_classes_set (Set[Type]): Set mirror of `_base_classes` for constant-time membership checks.
         _operations (Dict[str, Callable]): Dictionary mapping operation names to super-instance handlers.
         _registry (Dict[Type, Dict[str, Callable]]): Registry of object types and their available methods.
+        _registry_dirty (bool): True if the registry must be rebuilt before its next use.
 
     Notes:
-        - Uses `functools.lru_cache` to optimize method registry generation.
+        - The method registry is rebuilt lazily, only when marked dirty by a configuration change.
         - Logging is integrated via `common.utils.logging_setup.logger`.
         - Operations are executed via super-instances that must have an `execute` method.
         - Results are returned as dictionaries with keys: status (bool), object (Any), method (str | None),
@@ -30,6 +124,9 @@ class Manipulator(ABC):
         >>> manip.process_request({"operation": "append", "obj": [], "attributes": {"value": 1}})
         {"status": True, "object": [1], "method": "append", "result": True}
     """
+    __slots__ = ('_managing_object', '_strict_type_check', '_base_classes', '_base_classes_set',
+                 '_operations', '_registry', '_registry_dirty')
+
     def __init__(self, managing_object: Optional[Any] = None,
                  base_classes: Optional[List[Type]] = None,
                  operations: Optional[Dict[str, Callable]] = None,
@@ -38,18 +135,22 @@ class Manipulator(ABC):
 
         Args:
             managing_object (Optional[Any]): The central object to manage. Defaults to None.
-            base_classes (Optional[List[Type]]): List of base classes for method registration. Defaults to None.
+            base_classes (Optional[List[Type]]): Base classes for method registration; the sequence is copied,
+                not mutated. Defaults to None.
             operations (Optional[Dict[str, Callable]]): Initial operations to register. Defaults to None.
             strict_type_check (bool): If True, enforce strict type checking for objects. Defaults to False.
         """
         self._managing_object = managing_object
         self._strict_type_check = strict_type_check
-        self._base_classes = base_classes if base_classes is not None else []
-        if managing_object is not None and type(managing_object) not in self._base_classes:
+        self._base_classes = list(base_classes) if base_classes else []
+        self._base_classes_set = set(self._base_classes)
+        if managing_object is not None and type(managing_object) not in self._base_classes_set:
+            self._base_classes_set.add(type(managing_object))
             self._base_classes.append(type(managing_object))
         self._operations = operations or {}
-        self._registry = self._get_method_registry()
-        logger.info(f"Initialized Manipulator with {len(self._operations)} initial operations")
+        self._registry = {}
+        self._registry_dirty = True
+        logger.info("Initialized Manipulator with %d initial operations", len(self._operations))
 
     def set_managing_object(self, obj: Any) -> None:
         """Set the central managing object.
@@ -58,10 +159,11 @@ class Manipulator(ABC):
             obj (Any): The object to set as the managing object.
         """
         self._managing_object = obj
-        if obj is not None and type(obj) not in self._base_classes:
+        if obj is not None and type(obj) not in self._base_classes_set:
+            self._base_classes_set.add(type(obj))
             self._base_classes.append(type(obj))
-            self.update_registry()
-        logger.info(f"Set managing object of type '{type(obj).__name__}' in Manipulator")
+            self._registry_dirty = True
+        logger.info("Set managing object of type '%s' in Manipulator", type(obj).__name__)
 
     def get_managing_object(self) -> Optional[Any]:
         """Retrieve the central managing object.
@@ -88,7 +190,7 @@ class Manipulator(ABC):
         if effective_obj is None:
             logger.error(f"No {obj_type} or managing object provided for operation")
             raise ValueError(f"No {obj_type} or managing object provided")
-        if self._strict_type_check and type(effective_obj) not in self._registry:
+        if self._strict_type_check and type(effective_obj) not in self._ensure_registry():
             logger.error(f"Unsupported object type for {obj_type}: {type(effective_obj)}")
             raise ValueError(f"Unsupported object type: {type(effective_obj)}")
         return effective_obj
@@ -104,11 +206,20 @@ class Manipulator(ABC):
 
         Raises:
             ValueError: If no methods are registered for the type.
+
+        Notes:
+            - Methods of registered super-instances are expanded on first lookup of their type.
         """
-        if obj_type not in self._registry:
+        registry = self._ensure_registry()
+        try:
+            return registry[obj_type]
+        except KeyError:
+            for instance in self._operations.values():
+                if type(instance) is obj_type:
+                    methods = registry[obj_type] = _operation_methods(instance)
+                    return methods
             logger.error(f"No methods registered for type {obj_type.__name__}")
-            raise ValueError(f"No methods registered for type {obj_type.__name__}")
-        return self._registry[obj_type]
+            raise ValueError(f"No methods registered for type {obj_type.__name__}") from None
 
     def update_registry(self, additional_classes: Optional[List[Type]] = None, clear_operations: bool = False) -> None:
         """Update the method registry with additional base classes or clear operations.
@@ -121,10 +232,13 @@ class Manipulator(ABC):
             self._operations.clear()
             logger.info("Cleared all operations in registry")
         if additional_classes:
-            self._base_classes.extend([cls for cls in additional_classes if cls not in self._base_classes])
-        self._get_method_registry.cache_clear()
-        self._registry = self._get_method_registry()
-        logger.info(f"Registry updated with {len(self._registry)} types")
+            for cls in additional_classes:
+                if cls not in self._base_classes_set:
+                    self._base_classes_set.add(cls)
+                    self._base_classes.append(cls)
+        self._registry_dirty = True
+        self._ensure_registry()
+        logger.info("Registry updated with %d types", len(self._registry))
 
     def register_operation(self, operation: str, super_instance: Callable) -> None:
         """Register an operation with its super-instance handler.
@@ -144,20 +258,25 @@ class Manipulator(ABC):
             raise ValueError(f"Super-instance for '{operation}' must have 'execute' method")
         super_instance._operation = operation
         self._operations[operation] = super_instance
+        self._registry_dirty = True
+        logger.info("Registered operation '%s' with %s", operation, type(super_instance).__name__)
 
-        super_type = type(super_instance)
-        if super_type not in self._registry:
-            methods = {
-                name: method for name, method in inspect.getmembers(super_instance, predicate=inspect.ismethod)
-                if not name.startswith('__') and callable(method)
-            }
-            self._registry[super_type] = methods
-            logger.debug(f"Registered {len(methods)} methods for {super_type.__name__}")
-        logger.info(f"Registered operation '{operation}' with {type(super_instance).__name__}")
+    def _ensure_registry(self) -> Dict[Type, Dict[str, Callable]]:
+        """Rebuild the method registry if it is marked dirty.
+
+        Returns:
+            Dict[Type, Dict[str, Callable]]: The up-to-date registry of types and their methods.
+        """
+        if self._registry_dirty:
+            self._registry = self._get_method_registry()
+            self._registry_dirty = False
+        return self._registry
 
-    @lru_cache(maxsize=2048)
     def _get_method_registry(self, validate_annotations: bool = False) -> Dict[Type, Dict[str, Callable]]:
-        """Generate and cache the method registry for registered operations and base classes.
+        """Generate the method registry for base classes.
+
+        Methods of registered operations are expanded lazily by `get_methods_for_type`, unless
+        annotation validation is requested, in which case they are scanned eagerly.
 
         Args:
             validate_annotations (bool): If True, validate method return annotations. Defaults to False.
@@ -165,42 +284,31 @@ class Manipulator(ABC):
         Returns:
             Dict[Type, Dict[str, Callable]]: Registry of types and their methods.
         """
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         registry = {}
-        for operation, instance in self._operations.items():
-            super_type = type(instance)
-            methods = {
-                name: method for name, method in inspect.getmembers(instance, predicate=inspect.ismethod)
-                if not name.startswith('__') and callable(method)
-            }
-            if validate_annotations:
+        if validate_annotations:
+            for operation, instance in self._operations.items():
+                super_type = type(instance)
+                methods = _operation_methods(instance)
                 for name, method in methods.items():
-                    sig = inspect.signature(method)
-                    if not sig.return_annotation or sig.return_annotation is inspect.Signature.empty:
+                    annotations = getattr(method, '__annotations__', None)
+                    if not annotations or 'return' not in annotations:
                         logger.warning(f"Method {name} in {super_type.__name__} lacks return annotation")
-            registry[super_type] = methods
-            logger.debug(f"Registered {len(methods)} methods for {super_type.__name__}: {list(methods.keys())}")
+                registry[super_type] = methods
+                if debug_enabled:
+                    logger.debug("Registered %d methods for %s: %s", len(methods), super_type.__name__, list(methods))
 
         for cls in self._base_classes:
-            methods = {}
-            if cls in (list, dict, set):
-                for name in dir(cls):
-                    if name.startswith('_'):
-                        continue
-                    method = getattr(cls, name, None)
-                    if callable(method) and not isinstance(method, (type, property)):
-                        methods[name] = method
-            else:
-                for name, method in inspect.getmembers(cls, predicate=lambda x: inspect.isfunction(x) or inspect.ismethod(x)):
-                    if name.startswith('_') or not callable(method) or name in ('__getattribute__', '__setattr__'):
-                        continue
-                    if validate_annotations:
-                        sig = inspect.signature(method)
-                        if not sig.return_annotation or sig.return_annotation is inspect.Signature.empty:
-                            logger.warning(f"Method {name} in {cls.__name__} lacks return annotation")
-                    methods[name] = method
+            methods = _methods_for_class(cls)
+            if validate_annotations and cls not in _BUILTIN_METHODS:
+                for name, method in methods.items():
+                    annotations = getattr(method, '__annotations__', None)
+                    if not annotations or 'return' not in annotations:
+                        logger.warning(f"Method {name} in {cls.__name__} lacks return annotation")
             if methods:
                 registry[cls] = methods
-                logger.debug(f"Registered {len(methods)} methods for {cls.__name__}: {list(methods.keys())}")
+                if debug_enabled:
+                    logger.debug("Registered %d methods for %s: %s", len(methods), cls.__name__, list(methods))
             else:
                 logger.warning(f"No valid methods found for {cls.__name__}")
         return registry
@@ -216,7 +324,8 @@ class Manipulator(ABC):
 
         Returns:
             Any: For a single request, a dictionary with status, object, method, result, and error (if status=False).
-                For a sequence of requests, a dictionary mapping request IDs to results.
+                For a sequence of requests, a dictionary mapping request IDs to results. A request without
+                "operation" whose values are not all dicts is not a sequence and gets a single error dictionary.
 
         Raises:
             TypeError: If the request is not a dictionary or contains invalid types.
@@ -226,83 +335,57 @@ class Manipulator(ABC):
             logger.error(f"Invalid request type: expected dict, got {type(request).__name__}")
             raise TypeError(f"Request must be a dictionary, got {type(request).__name__}")
 
-        # Debug: Log request keys and types
-        logger.debug(f"Request keys and types: {[(k, type(v).__name__) for k, v in request.items()]}")
-
-        # Check if the request is a potential sequence (no 'operation' key and multiple keys)
-        is_potential_sequence = len(request) > 0 and "operation" not in request
-
-        if is_potential_sequence:
-            # Validate that all sub-requests are dictionaries
-            invalid_sub_requests = [
-                (k, type(v).__name__) for k, v in request.items() if not isinstance(v, dict)
-            ]
-            if invalid_sub_requests:
-                error_msg = f"Invalid sub-request type in sequence: {invalid_sub_requests}"
+        # Fast path: a single request carries its own 'operation' key
+        if "operation" in request:
+            error_msg = _validate_fields(request)
+            if error_msg is not None:
                 logger.error(error_msg)
-                return {
-                    "status": False,
-                    "object": None,
-                    "method": None,
-                    "result": None,
-                    "error": error_msg
-                }
-
-            # If all sub-requests are dictionaries, process as sequence
-            logger.info(f"Processing sequence of {len(request)} requests")
-            results = {}
-            for req_id, sub_request in request.items():
-                if "operation" not in sub_request:
-                    logger.error(f"Missing 'operation' in sub-request for ID '{req_id}'")
-                    results[req_id] = {
-                        "status": False,
-                        "object": sub_request.get("obj"),
-                        "method": None,
-                        "result": None,
-                        "error": "Missing 'operation' in sub-request"
-                    }
-                    continue
-                if "method" in sub_request and not isinstance(sub_request["method"], (str, type(None))):
-                    logger.error(f"Invalid 'method' type in sub-request for ID '{req_id}': expected str or None, got {type(sub_request['method']).__name__}")
-                    results[req_id] = {
-                        "status": False,
-                        "object": sub_request.get("obj"),
-                        "method": None,
-                        "result": None,
-                        "error": f"Invalid 'method' type: expected str or None, got {type(sub_request['method']).__name__}"
-                    }
-                    continue
-                if "attributes" in sub_request and not isinstance(sub_request["attributes"], (dict, type(None))):
-                    logger.error(f"Invalid 'attributes' type in sub-request for ID '{req_id}': expected dict or None, got {type(sub_request['attributes']).__name__}")
-                    results[req_id] = {
-                        "status": False,
-                        "object": sub_request.get("obj"),
-                        "method": None,
-                        "result": None,
-                        "error": f"Invalid 'attributes' type: expected dict or None, got {type(sub_request['attributes']).__name__}"
-                    }
-                    continue
-                result = self._process_single_request(sub_request)
-                results[req_id] = result
-            logger.debug(f"Sequence processing results: {results}")
-            return results
-
-        if "operation" not in request:
+                return _error(request.get("obj"), error_msg)
+            return self._process_single_request(request)
+
+        # Debug: Log request keys and types
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request keys and types: %s", [(k, type(v).__name__) for k, v in request.items()])
+
+        if not request:
             error_msg = "No operation specified in request"
             logger.error(error_msg)
-            return {"status": False, "object": request.get("obj"), "method": None, "result": None, "error": error_msg}
+            return _error(None, error_msg)
 
-        if "method" in request and not isinstance(request["method"], (str, type(None))):
-            error_msg = f"Invalid 'method' type: expected str or None, got {type(request['method']).__name__}"
+        # No 'operation' key: treat the request as a sequence of sub-requests. A malformed request
+        # (any value that is not a sub-request dict) is rejected as a whole, before anything runs.
+        if not all(isinstance(sub_request, dict) for sub_request in request.values()):
+            invalid_sub_requests = [(k, type(v).__name__) for k, v in request.items() if not isinstance(v, dict)]
+            error_msg = f"Invalid sub-request type in sequence: {invalid_sub_requests}"
             logger.error(error_msg)
-            return {"status": False, "object": request.get("obj"), "method": None, "result": None, "error": error_msg}
+            return _error(None, error_msg)
+        logger.info("Processing sequence of %d requests", len(request))
+        results = {}
+        set_result = results.__setitem__
+        handle_sub_request = self._handle_sub_request
+        for req_id, sub_request in request.items():
+            set_result(req_id, handle_sub_request(req_id, sub_request))
+        logger.debug("Sequence processing results: %s", results)
+        return results
+
+    def _handle_sub_request(self, req_id: Any, sub_request: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate and process one sub-request of a sequence.
 
-        if "attributes" in request and not isinstance(request["attributes"], (dict, type(None))):
-            error_msg = f"Invalid 'attributes' type: expected dict or None, got {type(request['attributes']).__name__}"
-            logger.error(error_msg)
-            return {"status": False, "object": request.get("obj"), "method": None, "result": None, "error": error_msg}
+        Args:
+            req_id (Any): The ID of the sub-request within the sequence.
+            sub_request (Dict[str, Any]): The sub-request to process.
 
-        return self._process_single_request(request)
+        Returns:
+            Dict[str, Any]: Dictionary with status, object, method, result, and error (if status=False).
+        """
+        if "operation" not in sub_request:
+            logger.error(f"Missing 'operation' in sub-request for ID '{req_id}'")
+            return _error(sub_request.get("obj"), "Missing 'operation' in sub-request")
+        error_msg = _validate_fields(sub_request)
+        if error_msg is not None:
+            logger.error(f"{error_msg} in sub-request for ID '{req_id}'")
+            return _error(sub_request.get("obj"), error_msg)
+        return self._process_single_request(sub_request)
 
     def _process_single_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process a single request by executing the specified operation.
@@ -313,40 +396,43 @@ class Manipulator(ABC):
         Returns:
             Dict[str, Any]: Dictionary with status, object, method, result, and error (if status=False).
         """
+        log_error = logger.error
         operation = request.get("operation")
         obj = request.get("obj")
         method = request.get("method")
-        attributes = request.get("attributes", {})
+        attributes = request.get("attributes") or {}
 
         if not operation:
             error_msg = "No operation specified in request"
-            logger.error(error_msg)
-            return {"status": False, "object": obj, "method": None, "result": None, "error": error_msg}
+            log_error(error_msg)
+            return _error(obj, error_msg)
 
-        super_instance = self._operations.get(operation)
-        if super_instance is None:
+        try:
+            super_instance = self._operations[operation]
+        except KeyError:
             error_msg = f"Operation '{operation}' not registered"
-            logger.error(error_msg)
-            return {"status": False, "object": obj, "method": None, "result": None, "error": error_msg}
+            log_error(error_msg)
+            return _error(obj, error_msg)
 
         try:
             effective_obj = self._validate_object(obj, "request object")
         except ValueError as e:
-            logger.error(f"Object validation failed: {str(e)}")
-            return {"status": False, "object": obj, "method": None, "result": None, "error": str(e)}
+            log_error(f"Object validation failed: {str(e)}")
+            return _error(obj, str(e))
 
-        execute_args = {"obj": effective_obj}
+        # 'attributes' type is already checked by process_request; empty dicts are passed through uncopied
         if attributes or method:
-            if not isinstance(attributes, dict):
-                logger.error(f"Attributes must be a dictionary, got {type(attributes).__name__}")
-                return {"status": False, "object": effective_obj, "method": None, "result": None, "error": "Invalid attributes type"}
-            execute_args["attributes"] = attributes.copy()
-            if method:
-                execute_args["method"] = method
+            execute_args = {
+                "obj": effective_obj,
+                "attributes": attributes.copy() if attributes else attributes,
+                "method": method
+            }
+        else:
+            execute_args = {"obj": effective_obj}
 
         try:
             super_result = super_instance.execute(**execute_args)
-            logger.debug(f"Processed operation '{operation}' on {type(effective_obj).__name__}")
+            logger.debug("Processed operation '%s' on %s", operation, type(effective_obj).__name__)
             result_dict = {
                 "status": super_result["status"],
                 "object": super_result["object"],
@@ -357,8 +443,8 @@ class Manipulator(ABC):
                 result_dict["error"] = super_result["error"]
             return result_dict
         except Exception as e:
-            logger.error(f"Failed to process request '{operation}' via execute: {str(e)}")
-            return {"status": False, "object": effective_obj, "method": None, "result": None, "error": str(e)}
+            log_error(f"Failed to process request '{operation}' via execute: {str(e)}")
+            return _error(effective_obj, str(e))
 
     def get_supported_operations(self) -> List[str]:
         """Retrieve the list of supported operation names.
@@ -368,6 +454,17 @@ class Manipulator(ABC):
         """
         return list(self._operations.keys())
 
+    def get_operation(self, operation: str) -> Optional[Any]:
+        """Retrieve the super-instance registered for an operation.
+
+        Args:
+            operation (str): The name of the operation.
+
+        Returns:
+            Optional[Any]: The registered super-instance, or None if the operation is not registered.
+        """
+        return self._operations.get(operation)
+
     def __repr__(self) -> str:
         """Return a string representation of the Manipulator.
 
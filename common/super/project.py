@@ -1,6 +1,8 @@
 # /common/super/project.py
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, Type, List, TypeVar
+from functools import lru_cache
+from types import new_class
 from common.utils.validation import check_non_empty_string
 from common.utils.logging_setup import logger
 from common.base.basecontainer import BaseContainer
@@ -15,6 +17,7 @@ class Project(ABC):
         _items (BaseContainer[BaseEntity]): Container of BaseEntity items indexed by their names.
         _item_type (Type[BaseEntity]): The type of items stored in the container, defaults to BaseEntity.
     """
+    __slots__ = ('name', '_items', '_items_add', '_items_get', '_items_set', '_items_remove', '_items_has')
     name: str
     _item_type: Type[BaseEntity] = BaseEntity
 
@@ -23,14 +26,24 @@ class Project(ABC):
         check_non_empty_string(name, "Project name")
         self.name = name
         self._items = self._create_container(items=items, name=f"{name}_items")
-        logger.info(f"Initialized project '{name}' with {len(self._items)} items")
+        # bind hot container methods once to skip the extra attribute lookup per call
+        self._items_add = self._items.add
+        self._items_get = self._items.get
+        self._items_set = self._items.set_item
+        self._items_remove = self._items.remove
+        self._items_has = self._items.has_item
+        logger.info("Initialized project '%s' with %d items", name, len(self._items))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _typed_container_class(cls) -> Type[BaseContainer]:
+        """Build the BaseContainer subclass for the project's item type once per project class."""
+        return new_class(f"TypedContainer_{cls._item_type.__name__}", (BaseContainer[cls._item_type],))
 
     @classmethod
     def _create_container(cls, items: Optional[Dict[str, BaseEntity]] = None, name: str = None) -> BaseContainer:
         """Create a BaseContainer instance with the specified item type."""
-        class TypedContainer(BaseContainer[cls._item_type]):
-            pass
-        return TypedContainer(items=items, name=name)
+        return cls._typed_container_class()(items=items, name=name)
 
     def add_item(self, item: BaseEntity) -> None:
         """Add a BaseEntity item to the project's container.
@@ -44,10 +57,10 @@ class Project(ABC):
         """
         if not isinstance(item, self._item_type):
             raise TypeError(f"Item must be of type {self._item_type.__name__} for project '{self.name}', got {type(item).__name__}")
-        if self._items.has_item(item.name):
+        if self._items_has(item.name):
             raise ValueError(f"Item with name '{item.name}' already exists in project '{self.name}'")
-        self._items.add(item)
-        logger.info(f"Added item '{item.name}' to project '{self.name}'")
+        self._items_add(item)
+        logger.info("Added item '%s' to project '%s'", item.name, self.name)
 
     @abstractmethod
     def create_item(self, item_code: str = "ITEM_DEFAULT", isactive: bool = True) -> None:
@@ -56,13 +69,13 @@ class Project(ABC):
 
     def set_item(self, name: str, item: BaseEntity) -> None:
         """Set an item in the project by its name."""
-        self._items.set_item(name, item)
-        logger.info(f"Set item '{item.name}' in project '{self.name}'")
+        self._items_set(name, item)
+        logger.info("Set item '%s' in project '%s'", item.name, self.name)
 
     def remove_item(self, name: str) -> None:
         """Remove an item from the project by its name."""
-        self._items.remove(name)
-        logger.info(f"Removed item '{name}' from project '{self.name}'")
+        self._items_remove(name)
+        logger.info("Removed item '%s' from project '%s'", name, self.name)
     
     def get_active_items(self) -> List[T]:
         """Retrieve all active items in the container.
@@ -82,9 +95,7 @@ class Project(ABC):
 
     def get_item(self, name: str) -> BaseEntity:
         """Retrieve an item from the project by its name."""
-        item = self._items.get(name)
-        logger.info(f"Retrieved item '{name}' from project '{self.name}'")
-        return item
+        return self._items_get(name)
 
     def get_items(self) -> Dict[str, BaseEntity]:
         """Retrieve all items in the project as a dictionary."""
@@ -92,38 +103,38 @@ class Project(ABC):
 
     def get_name(self) -> str:
         """Retrieve the project's name."""
-        logger.info(f"Retrieved name '{self.name}' for project")
         return self.name
 
     def set_name(self, name: str) -> None:
         """Set the project's name."""
         check_non_empty_string(name, "Project name")
+        if name == self.name:
+            return
         old_name = self.name
         self.name = name
         self._items.name = f"{name}_items"
-        logger.info(f"Project name changed from '{old_name}' to '{name}'")
+        logger.info("Project name changed from '%s' to '%s'", old_name, name)
 
     def set_project(self, name: str, items: Dict[str, BaseEntity]) -> None:
         """Set the entire project configuration, replacing name and items."""
         check_non_empty_string(name, "Project name")
         old_name = self.name
         old_count = len(self._items)
-        self.name = name
         self._items.set_items(items)
-        self._items.name = f"{name}_items"
-        logger.info(f"Project updated: name changed from '{old_name}' to '{name}', "
-                    f"items count changed from {old_count} to {len(self._items)}")
+        if name != old_name:
+            self.name = name
+            self._items.name = f"{name}_items"
+        logger.info("Project updated: name changed from '%s' to '%s', items count changed from %d to %d",
+                    old_name, name, old_count, len(self._items))
 
     def get_project(self) -> Dict[str, Any]:
         """Get the entire project configuration as a dictionary."""
-        result = {"name": self.name, "items": self._items.to_dict()["items"]}
-        logger.info(f"Retrieved project configuration for '{self.name}' with {len(self._items)} items")
-        return result
+        return self.to_dict()
     
     def clear(self) -> None:
         "Clear all items from container."
         self._items.clear()
-        logger.info(f"Removed from project '{self.name}' all {len(self._items)} items")
+        logger.info("Removed from project '%s' all %d items", self.name, len(self._items))
     
     def activate_all(self) -> None:
         """Activate all items in the container.
@@ -159,7 +170,11 @@ class Project(ABC):
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the project to a dictionary for serialization."""
-        return {"name": self.name, "items": self._items.to_dict()["items"]}
+        return {"name": self.name, "items": self._to_dict_items()}
+
+    def _to_dict_items(self) -> Dict[str, Any]:
+        """Serialize the project's items without the container wrapper."""
+        return self._items.to_dict()["items"]
 
     @classmethod
     @abstractmethod
@@ -25,66 +25,6 @@ class Ui_MainWindow(object):
         if not MainWindow.objectName():
             MainWindow.setObjectName(u"MainWindow")
         MainWindow.resize(996, 717)
-        MainWindow.setStyleSheet(u"\n"
-"QMainWindow {\n"
-"    background-color: #f5f5f5;\n"
-"    font-family: Arial, sans-serif;\n"
-"}\n"
-"QMenuBar {\n"
-"    background-color: #ffffff;\n"
-"    color: #333333;\n"
-"    padding: 4px;\n"
-"}\n"
-"QMenuBar::item {\n"
-"    background: #ffffff;\n"
-"    padding: 4px 8px;\n"
-"    color: #333333;\n"
-"}\n"
-"QMenuBar::item:selected {\n"
-"    background: #0078d7;\n"
-"    color: #ffffff;\n"
-"}\n"
-"QMenu {\n"
-"    background-color: #ffffff;\n"
-"    border: 1px solid #d3d3d3;\n"
-"    color: #333333;\n"
-"}\n"
-"QMenu::item {\n"
-"    padding: 4px 24px 4px 8px;\n"
-"    background: #ffffff;\n"
-"    color: #333333;\n"
-"}\n"
-"QMenu::item:selected {\n"
-"    background: #0078d7;\n"
-"    color: #ffffff;\n"
-"}\n"
-"QTreeView {\n"
-"    background-color: #ffffff;\n"
-"    border: 1px solid #d3d3d3;\n"
-"    selection-background-color: #0078d7;\n"
-"    selection-color: #ffffff;\n"
-"    font-size: 12px;\n"
-"}\n"
-"QTabWidget::pane {\n"
-"    border: 1px solid #d3d3d3;\n"
-"    background: #ffffff;\n"
-"}\n"
-"QTabBar::tab {\n"
-"    ba"
-                        "ckground: #f0f0f0;\n"
-"    padding: 4px 8px;\n"
-"    border: 1px solid #d3d3d3;\n"
-"    border-bottom: none;\n"
-"}\n"
-"QTabBar::tab:selected {\n"
-"    background: #0078d7;\n"
-"    color: #ffffff;\n"
-"}\n"
-"QGraphicsView {\n"
-"    background-color: #ffffff;\n"
-"    border: 1px solid #d3d3d3;\n"
-"}\n"
-"   ")
         self.actionNewProject = QAction(MainWindow)
         self.actionNewProject.setObjectName(u"actionNewProject")
         self.actionOpenProject = QAction(MainWindow)
@@ -2,36 +2,84 @@
 import sys
 import os
 import json
-from typing import Dict, Any
+import orjson
+from functools import partial
+from typing import Dict, Any, List, Mapping, Optional
+from jinja2 import Template
 from PySide6.QtWidgets import (
     QMainWindow, 
     QApplication, 
     QFileDialog, 
     QMessageBox, 
-    QTreeView, 
     QMenu, 
     QGraphicsScene, 
+    QGraphicsView, 
     QTabBar, 
     QWidget
 )
-from PySide6.QtCore import Qt, Signal, Slot, QPoint
-from PySide6.QtGui import QStandardItemModel, QStandardItem
+from PySide6.QtCore import Qt, Signal, Slot, QPoint, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QStandardItemModel, QStandardItem, QSurfaceFormat, QPainter
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
 from wizard.super.wizard_manipulator import WizardManipulator
 from wizard.super.wizard_project import WizardProject
+from wizard.super.wizard_generator import project_context, render_template
 from wizard.base.wizard_block import WizardBlock
 from common.utils.logging_setup import logger, setup_logging, update_logging_level
 import logging
 
 from gui.ui_main_window import Ui_MainWindow
 
+# Project Explorer item type role and its values
+ROLE_TYPE = Qt.UserRole + 1
+_PROJECT_TYPE = "project"
+_BLOCKS_TYPE = "blocks"
+_BLOCK_TYPE = "block"
+
+class GenerateTaskSignals(QObject):
+    """Signals emitted by GenerateTask."""
+    finished = Signal(dict)
+
+
+class GenerateTask(QRunnable):
+    """Render a project template on a QThreadPool worker.
+
+    Args:
+        template: Compiled template to render.
+        context: Read-only template context built on the GUI thread with project_context.
+    """
+
+    def __init__(self, template: Template, context: Mapping[str, Any]):
+        super().__init__()
+        self.template = template
+        self.context = context
+        self.signals = GenerateTaskSignals()
+
+    def run(self):
+        """Render the template and emit the response."""
+        try:
+            result = {"status": True, "result": render_template(self.template, **self.context)}
+        except Exception as e:
+            result = {"status": False, "error": str(e)}
+        self.signals.finished.emit(result)
+
+
 class MSBWizardMainWindow(QMainWindow):
     """Main application window for MSBWizard."""
     project_updated = Signal()
+    _SETTINGS_FILE = "settings.json"
+    # Parsed settings shared by all windows, invalidated by save_settings or a newer file mtime
+    _settings_cache: Optional[Dict[str, Any]] = None
+    _settings_mtime: Optional[float] = None
 
     def __init__(self):
         super().__init__()
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
+        self._project_explorer = self.ui.projectExplorer
+        # Reused non-modal message box for errors, so failures do not block the event loop
+        self._errorbox = QMessageBox(self)
+        self._errorbox.setWindowTitle("Error")
+        self._errorbox.setWindowModality(Qt.NonModal)
         self.settings = self.load_settings()
         
         # Настройка логирования
@@ -45,11 +93,24 @@ class MSBWizardMainWindow(QMainWindow):
         self.project = WizardProject(name="Untitled Project")
         self.scene = QGraphicsScene()
         self.ui.canvasView.setScene(self.scene)
+        # Repaint the whole viewport at once instead of tracking per-block dirty rects
+        self.ui.canvasView.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
         self.manipulator = WizardManipulator(managing_object=self.project, scene=self.scene)
-        logger.debug(f"MSBWizardMainWindow initialized with project id: {id(self.project)}, manipulator id: {id(self.manipulator)}, scene id: {id(self.scene)}")
+        logger.debug("MSBWizardMainWindow initialized with project id: %s, manipulator id: %s, scene id: %s", id(self.project), id(self.manipulator), id(self.scene))
 
         self.current_project_path = None
-        self._action_connections = {}
+
+        # Persistent Project Explorer model, updated incrementally on project changes
+        self._explorer_model = QStandardItemModel()
+        self._explorer_model.setHorizontalHeaderLabels(["Project Explorer"])
+        self._project_item = QStandardItem()
+        self._project_item.setData(_PROJECT_TYPE, ROLE_TYPE)
+        self._explorer_model.invisibleRootItem().appendRow(self._project_item)
+        self._blocks_item = QStandardItem("Blocks")
+        self._blocks_item.setData(_BLOCKS_TYPE, ROLE_TYPE)
+        self._project_item.appendRow(self._blocks_item)
+        self._block_items: Dict[str, QStandardItem] = {}
+
         self.setup_ui()
         self.setup_connections()
 
@@ -58,6 +119,18 @@ class MSBWizardMainWindow(QMainWindow):
         self.ui.dockWidget.setVisible(True)
         self.update_project_explorer()
 
+        # Render the canvas through OpenGL; QOpenGLWidget relies on FullViewportUpdate set in __init__
+        canvas_viewport = QOpenGLWidget()
+        surface_format = QSurfaceFormat()
+        surface_format.setSamples(4)
+        canvas_viewport.setFormat(surface_format)
+        self.ui.canvasView.setViewport(canvas_viewport)
+        self.ui.canvasView.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        self.ui.canvasView.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
+        self.ui.canvasView.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform)
+        # Blocks are added, removed and moved often, so skip BSP index maintenance
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+
         # Настраиваем вкладки
         for i in range(self.ui.tabContainer.count()):
             if self.ui.tabContainer.widget(i).objectName() == "projectInfoTab":
@@ -67,21 +140,17 @@ class MSBWizardMainWindow(QMainWindow):
         self.ui.tabContainer.setTabsClosable(True)
 
         # Настраиваем Project Explorer
-        project_explorer = self.ui.dockWidget.findChild(QTreeView, "projectExplorer")
-        if project_explorer:
-            project_explorer.setContextMenuPolicy(Qt.CustomContextMenu)
-            project_explorer.customContextMenuRequested.connect(self.show_context_menu)
-            logger.debug("Project explorer context menu connected")
-        else:
-            logger.error("Project explorer widget not found during setup_ui")
+        self._project_explorer.setModel(self._explorer_model)
+        self._project_explorer.expandRecursively(self._project_item.index())
+        self._project_explorer.setContextMenuPolicy(Qt.CustomContextMenu)
+        self._project_explorer.customContextMenuRequested.connect(self.show_context_menu)
+        logger.debug("Project explorer context menu connected")
 
         # Синхронизация видимости dockWidget
         self.ui.dockWidget.visibilityChanged.connect(self.sync_project_explorer_action)
 
     def setup_connections(self):
-        """Connect UI signals to slots, ensuring no duplicates."""
-        self.clear_connections()
-
+        """Connect UI signals to slots once; slots always act on the current project and manipulator."""
         actions = [
             (self.ui.actionNewProject, self.new_project),
             (self.ui.actionOpenProject, self.open_project),
@@ -91,78 +160,129 @@ class MSBWizardMainWindow(QMainWindow):
             (self.ui.actionPreferences, self.open_preferences),
         ]
         for action, slot in actions:
-            connection = action.triggered.connect(slot)
-            self._action_connections[action] = connection
-            logger.debug(f"Connected action {action.objectName()}")
-
-        project_explorer = self.ui.dockWidget.findChild(QTreeView, "projectExplorer")
-        if project_explorer:
-            project_explorer.clicked.connect(self.handle_project_explorer_click)
-            logger.debug("Connected project explorer clicked signal")
-        else:
-            logger.error("Project explorer widget not found during setup_connections")
+            action.triggered.connect(slot)
+        logger.debug("Connected %d actions", len(actions))
+
+        self._project_explorer.clicked.connect(self.handle_project_explorer_click)
+        logger.debug("Connected project explorer clicked signal")
 
         self.ui.tabContainer.tabCloseRequested.connect(self.handle_tab_close)
         self.project_updated.connect(self.update_project_explorer)
 
-    def clear_connections(self):
-        """Disconnect all action signals to prevent duplicates."""
-        for action, connection in self._action_connections.items():
-            try:
-                action.triggered.disconnect(connection)
-                logger.debug(f"Disconnected signal for action {action.objectName()}")
-            except Exception as e:
-                logger.debug(f"No signal to disconnect for action {action.objectName()}: {str(e)}")
-        self._action_connections.clear()
+    def load_settings(self) -> Dict[str, Any]:
+        """Load application settings from settings.json.
 
+        Parsed settings are cached on the class and reused while the file's modification time is unchanged.
+        """
+        cls = type(self)
+        settings_file = self._SETTINGS_FILE
         try:
-            self.project_updated.disconnect()
-            logger.debug("Disconnected project_updated signal")
-        except Exception as e:
-            logger.debug(f"No connections to disconnect for project_updated: {str(e)}")
+            mtime = os.stat(settings_file).st_mtime
+        except OSError:
+            mtime = None
+        if cls._settings_cache is not None and cls._settings_mtime == mtime:
+            logger.debug("Using cached settings for '%s'", settings_file)
+            return dict(cls._settings_cache)
 
-    def load_settings(self) -> Dict[str, Any]:
-        """Load application settings from settings.json."""
-        settings_file = "settings.json"
         default_settings = {
             "log_level": "DEBUG",
             "template_path": "templates",
         }
-        if os.path.exists(settings_file):
+        if mtime is not None:
             try:
-                with open(settings_file, "r") as f:
-                    loaded_settings = json.load(f)
+                with open(settings_file, "rb") as f:
+                    loaded_settings = orjson.loads(f.read())
                 default_settings.update(loaded_settings)
-                logger.info(f"Settings loaded from '{settings_file}'")
+                logger.info("Settings loaded from '%s'", settings_file)
+                cls._settings_cache = dict(default_settings)
+                cls._settings_mtime = mtime
                 return default_settings
             except Exception as e:
                 logger.error(f"Failed to load settings from '{settings_file}': {str(e)}")
-                QMessageBox.warning(self, "Error", f"Failed to load settings: {str(e)}")
+                self.show_error(f"Failed to load settings: {str(e)}", QMessageBox.Warning)
+                return default_settings
         logger.info("No settings file found, using default settings")
+        cls._settings_cache = dict(default_settings)
+        cls._settings_mtime = None
         return default_settings
 
     def save_settings(self, settings: Dict[str, Any]):
-        """Save application settings to settings.json."""
+        """Save application settings to settings.json and refresh the settings cache."""
+        cls = type(self)
+        settings_file = self._SETTINGS_FILE
         try:
-            with open("settings.json", "w") as f:
+            with open(settings_file, "w") as f:
                 json.dump(settings, f, indent=4)
-            logger.info("Settings saved to 'settings.json'")
+            cls._settings_cache = dict(settings)
+            cls._settings_mtime = os.stat(settings_file).st_mtime
+            logger.info("Settings saved to '%s'", settings_file)
         except Exception as e:
-            logger.error(f"Failed to save settings to 'settings.json': {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to save settings: {str(e)}")
+            logger.error(f"Failed to save settings to '{settings_file}': {str(e)}")
+            self.show_error(f"Failed to save settings: {str(e)}")
+
+    def show_error(self, message: str, icon: QMessageBox.Icon = QMessageBox.Critical):
+        """Show an error in the shared non-modal message box.
+
+        Args:
+            message: Text to display.
+            icon: Message box icon, critical by default.
+        """
+        self._errorbox.setIcon(icon)
+        self._errorbox.setText(message)
+        self._errorbox.show()
+
+    def show_status(self, message: str, timeout: int = 3000):
+        """Show an informational message in the status bar.
+
+        Args:
+            message: Text to display.
+            timeout: Time in milliseconds before the message is cleared.
+        """
+        self.statusBar().showMessage(message, timeout)
+
+    def process_scene_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Process a request that draws on the canvas with scene signals suppressed.
+
+        Args:
+            request: Request for the manipulator.
+
+        Returns:
+            Dict[str, Any]: Response of the request.
+        """
+        self.scene.blockSignals(True)
+        try:
+            response = self.manipulator.process_request(request)
+        finally:
+            self.scene.blockSignals(False)
+        self.scene.update()
+        return response
+
+    def manage_and_render_blocks(self, blocks: List[WizardBlock], attributes: Dict[str, Any]) -> Dict[str, Any]:
+        """Manage and render blocks in one batched request with scene signals suppressed.
+
+        Args:
+            blocks: Blocks to process.
+            attributes: "manage" and "render" attributes of the manage_and_render request.
+
+        Returns:
+            Dict[str, Any]: Response of the manage_and_render request.
+        """
+        return self.process_scene_request({
+            "operation": "manage_and_render",
+            "obj": self.project,
+            "attributes": {"blocks": blocks, **attributes}
+        })
 
     @Slot()
     def new_project(self):
         """Create a new project, clearing old data."""
         logger.info("Creating new project")
-        self.clear_connections()
         for i in range(self.ui.tabContainer.count() - 1, -1, -1):
             self.ui.tabContainer.removeTab(i)
         self.project = WizardProject(name="Untitled Project")
         self.manipulator = WizardManipulator(managing_object=self.project, scene=self.scene)
         self.current_project_path = None
         self.ui.tabContainer.addTab(QWidget(), "Project")
-        self.setup_connections()
         self.update_project_explorer()
         logger.debug("New project created and UI updated")
 
@@ -172,31 +292,35 @@ class MSBWizardMainWindow(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(self, "Open Project", "", "MSBWizard Project (*.msb)")
         if file_path:
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                with open(file_path, "rb") as f:
+                    data = orjson.loads(f.read())
                 self.project = WizardProject.from_dict(data)
                 self.manipulator = WizardManipulator(managing_object=self.project, scene=self.scene)
                 self.current_project_path = file_path
+                self.scene.clear()
+                render_response = self.process_scene_request({"operation": "render", "obj": self.project})
+                if not render_response["status"]:
+                    logger.error(f"Failed to render project blocks: {render_response.get('error', 'Unknown error')}")
                 self.project_updated.emit()
                 for i in range(self.ui.tabContainer.count() - 1, -1, -1):
                     self.ui.tabContainer.removeTab(i)
                 self.ui.tabContainer.addTab(QWidget(), "Project")
-                logger.info(f"Project opened from '{file_path}'")
+                logger.info("Project opened from '%s'", file_path)
             except Exception as e:
                 logger.error(f"Failed to open project: {str(e)}")
-                QMessageBox.critical(self, "Error", f"Failed to open project: {str(e)}")
+                self.show_error(f"Failed to open project: {str(e)}")
 
     @Slot()
     def save_project(self):
         """Save the current project."""
         if self.current_project_path:
             try:
-                with open(self.current_project_path, "w") as f:
-                    json.dump(self.project.to_dict(), f, indent=4)
-                logger.info(f"Project saved to '{self.current_project_path}'")
+                with open(self.current_project_path, "wb") as f:
+                    f.write(orjson.dumps(self.project.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+                logger.info("Project saved to '%s'", self.current_project_path)
             except Exception as e:
                 logger.error(f"Failed to save project: {str(e)}")
-                QMessageBox.critical(self, "Error", f"Failed to save project: {str(e)}")
+                self.show_error(f"Failed to save project: {str(e)}")
         else:
             self.save_project_as()
 
@@ -212,24 +336,33 @@ class MSBWizardMainWindow(QMainWindow):
 
     @Slot()
     def generate_code(self):
-        """Generate code for the current project."""
+        """Generate code for the current project on a worker thread."""
         logger.debug("Generating code")
-        result = self.manipulator.process_request({
-            "operation": "generate",
-            "obj": self.project,
-            "attributes": {"template": "default_project_template"}
-        })
+        template_name = "default_project_template"
+        template = self.project.get_compiled(template_name)
+        if template is None:
+            logger.error(f"Template '{template_name}' not found")
+            self.show_error(f"Failed to generate code: Template '{template_name}' not found")
+            return
+        # The worker only reads this read-only context, so GUI edits to the project cannot race it
+        task = GenerateTask(template, project_context(self.project))
+        task.signals.finished.connect(self._on_generated)
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(dict)
+    def _on_generated(self, result: Dict[str, Any]):
+        """Handle the response of a finished GenerateTask."""
         if result["status"]:
-            logger.info(f"Generated code:\n{result['result']}")
-            QMessageBox.information(self, "Success", "Code generated successfully.")
+            logger.info("Generated code:\n%s", result['result'])
+            self.show_status("Code generated successfully.")
         else:
             logger.error(f"Failed to generate code: {result.get('error', 'Unknown error')}")
-            QMessageBox.critical(self, "Error", f"Failed to generate code: {result.get('error', 'Unknown error')}")
+            self.show_error(f"Failed to generate code: {result.get('error', 'Unknown error')}")
 
     @Slot()
     def open_preferences(self):
         """Open preferences dialog (not implemented)."""
-        QMessageBox.information(self, "Info", "Preferences dialog not implemented yet.")
+        self.show_status("Preferences dialog not implemented yet.")
         logger.info("Preferences dialog requested but not implemented")
 
     @Slot(int)
@@ -239,35 +372,31 @@ class MSBWizardMainWindow(QMainWindow):
         if widget.objectName() == "projectInfoTab":
             return
         self.ui.tabContainer.removeTab(index)
-        logger.debug(f"Closed tab at index {index}")
+        logger.debug("Closed tab at index %s", index)
 
     @Slot(QPoint)
     def show_context_menu(self, position: QPoint):
         """Show context menu for Project Explorer."""
-        project_explorer = self.ui.dockWidget.findChild(QTreeView, "projectExplorer")
-        if not project_explorer:
-            return
-
+        project_explorer = self._project_explorer
         index = project_explorer.indexAt(position)
         if not index.isValid():
             return
 
-        item = project_explorer.model().itemFromIndex(index)
-        if not item:
+        item_type = index.data(ROLE_TYPE)
+        if item_type is None:
             return
 
-        item_type = item.data(Qt.UserRole)
         menu = QMenu(self)
 
-        if item_type == "project":
+        if item_type == _PROJECT_TYPE:
             add_action = menu.addAction("Add Block")
             add_action.triggered.connect(self.add_block)
-        elif item_type == "block":
-            block_name = item.text()
+        elif item_type == _BLOCK_TYPE:
+            block_name = index.data(Qt.DisplayRole)
             edit_action = menu.addAction("Edit Block")
             remove_action = menu.addAction("Remove Block")
-            edit_action.triggered.connect(lambda: self.edit_block(block_name))
-            remove_action.triggered.connect(lambda: self.remove_block(block_name))
+            edit_action.triggered.connect(partial(self.edit_block, block_name))
+            remove_action.triggered.connect(partial(self.remove_block, block_name))
         else:
             return
 
@@ -276,33 +405,20 @@ class MSBWizardMainWindow(QMainWindow):
     @Slot()
     def add_block(self):
         """Add a new block to the project."""
-        block = WizardBlock(name=f"Block{len(self.project.blocks.get_all()) + 1}", block_type="entity")
-        response = self.manipulator.process_request({
-            "operation": "manage",
-            "obj": block,
-            "attributes": {"action": "create"}
-        })
+        block = WizardBlock(name=f"Block{len(self.project.blocks) + 1}", block_type="entity")
+        response = self.manage_and_render_blocks([block], {"manage": {"action": "create"}, "render": {"action": "add"}})
         if response["status"]:
-            logger.info(f"Block '{block.name}' added")
-            render_response = self.manipulator.process_request({
-                "operation": "render",
-                "obj": block,
-                "attributes": {"action": "add"}
-            })
-            if not render_response["status"]:
-                logger.error(f"Failed to render block '{block.name}': {render_response.get('error', 'Unknown error')}")
-                QMessageBox.critical(self, "Error", f"Failed to render block: {render_response.get('error', 'Unknown error')}")
-            else:
-                self.project_updated.emit()
+            logger.info("Block '%s' added", block.name)
+            self.project_updated.emit()
         else:
             logger.error(f"Failed to add block: {response.get('error', 'Unknown error')}")
-            QMessageBox.critical(self, "Error", f"Failed to add block: {response.get('error', 'Unknown error')}")
+            self.show_error(f"Failed to add block: {response.get('error', 'Unknown error')}")
 
     @Slot(str)
     def edit_block(self, block_name: str):
         """Edit an existing block (not fully implemented)."""
-        logger.debug(f"Editing block '{block_name}'")
-        QMessageBox.information(self, "Info", f"Edit block '{block_name}' not fully implemented.")
+        logger.debug("Editing block '%s'", block_name)
+        self.show_status(f"Edit block '{block_name}' not fully implemented.")
 
     @Slot(str)
     def remove_block(self, block_name: str):
@@ -315,7 +431,7 @@ class MSBWizardMainWindow(QMainWindow):
                 "attributes": {"action": "delete"}
             })
             if response["status"]:
-                logger.info(f"Block '{block_name}' removed")
+                logger.info("Block '%s' removed", block_name)
 
                 render_response = self.manipulator.process_request({
                     "operation": "render",
@@ -327,62 +443,63 @@ class MSBWizardMainWindow(QMainWindow):
                 self.project_updated.emit()
             else:
                 logger.error(f"Failed to remove block: {response.get('error', 'Unknown error')}")
-                QMessageBox.critical(self, "Error", f"Failed to remove block: {response.get('error', 'Unknown error')}")
+                self.show_error(f"Failed to remove block: {response.get('error', 'Unknown error')}")
         else:
             logger.error(f"Block '{block_name}' not found")
-            QMessageBox.critical(self, "Error", f"Block '{block_name}' not found")
+            self.show_error(f"Block '{block_name}' not found")
 
     @Slot()
     def handle_project_explorer_click(self, index):
         """Handle clicks on Project Explorer."""
-        item = self.ui.projectExplorer.model().itemFromIndex(index)
-        if not item:
-            return
-        item_type = item.data(Qt.UserRole)
-        if item_type == "project":
+        item_type = index.data(ROLE_TYPE)
+        if item_type == _PROJECT_TYPE:
             self.ui.tabContainer.setCurrentIndex(0)
-        elif item_type == "block":
-            block_name = item.text()
-            logger.debug(f"Clicked block: {block_name}")
+        elif item_type == _BLOCK_TYPE:
+            block_name = index.data(Qt.DisplayRole)
+            logger.debug("Clicked block: %s", block_name)
 
     def update_project_explorer(self):
-        """Update Project Explorer tree."""
-        project_explorer = self.ui.dockWidget.findChild(QTreeView, "projectExplorer")
-        if not project_explorer:
-            logger.error("Project explorer widget not found")
-            return
-
-        model = QStandardItemModel()
-        model.setHorizontalHeaderLabels(["Project Explorer"])
-        root = model.invisibleRootItem()
-
-        project_item = QStandardItem(f"Project: {self.project.name}")
-        project_item.setData("project", Qt.UserRole)
-        root.appendRow(project_item)
-
-        blocks_item = QStandardItem("Blocks")
-        blocks_item.setData("blocks", Qt.UserRole)
-        project_item.appendRow(blocks_item)
-
-        for block in self.project.blocks.get_all().values():
-            block_item = QStandardItem(block.name)
-            block_item.setData("block", Qt.UserRole)
-            blocks_item.appendRow(block_item)
-            logger.debug(f"Added block '{block.name}' to project explorer")
+        """Update Project Explorer tree, adding and removing only the changed block rows."""
+        self._project_item.setText(f"Project: {self.project.name}")
+
+        blocks = self.project.blocks.get_all()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        removed = self._block_items.keys() - blocks.keys()
+        for name in removed:
+            block_item = self._block_items.pop(name)
+            self._blocks_item.removeRow(block_item.row())
+            if debug_enabled:
+                logger.debug("Removed block '%s' from project explorer", name)
+
+        new_rows = []
+        for name in blocks:
+            if name in self._block_items:
+                continue
+            block_item = QStandardItem(name)
+            block_item.setData(_BLOCK_TYPE, ROLE_TYPE)
+            new_rows.append(block_item)
+            self._block_items[name] = block_item
+            if debug_enabled:
+                logger.debug("Added block '%s' to project explorer", name)
+        if new_rows:
+            self._blocks_item.appendRows(new_rows)
 
-        project_explorer.setModel(model)
-        project_explorer.expandAll()
-        project_explorer.viewport().update()
         logger.debug("Project explorer updated")
 
     @Slot(bool)
     def sync_project_explorer_action(self, visible: bool):
         """Synchronize the Project Explorer action with dockWidget visibility."""
 #        self.ui.actionProject_Explorer.setChecked(visible)
-        logger.debug(f"Project Explorer action synchronized: checked={visible}")
+        logger.debug("Project Explorer action synchronized: checked=%s", visible)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    style_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.qss")
+    try:
+        with open(style_path, "r", encoding="utf-8") as f:
+            app.setStyleSheet(f.read())
+    except OSError as e:
+        logger.warning("Failed to load stylesheet from '%s': %s", style_path, e)
     window = MSBWizardMainWindow()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
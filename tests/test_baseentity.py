@@ -0,0 +1,30 @@
+# tests/test_baseentity.py
+from common.base.baseentity import BaseEntity
+
+
+class CachedEntity(BaseEntity):
+    value: int
+
+    def __init__(self, name: str, value: int = 0, isactive: bool = True):
+        super().__init__(name=name, isactive=isactive, value=value, use_cache=True)
+
+
+def test_to_dict_reflects_renamed_entity():
+    entity = CachedEntity(name="A")
+    assert entity.to_dict()["name"] == "A"
+    entity.name = "B"
+    assert entity.to_dict()["name"] == "B"
+
+
+def test_to_dict_reflects_deactivated_entity():
+    entity = CachedEntity(name="A")
+    assert entity.to_dict()["isactive"] is True
+    entity.isactive = False
+    assert entity.to_dict()["isactive"] is False
+
+
+def test_to_dict_reflects_field_assignment():
+    entity = CachedEntity(name="A", value=1)
+    assert entity.to_dict()["value"] == 1
+    entity.value = 2
+    assert entity.to_dict()["value"] == 2
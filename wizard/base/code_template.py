@@ -1,6 +1,7 @@
 # wizard/base/code_template.py
 from typing import Dict, Any
 from common.base.baseentity import BaseEntity
+from wizard.base.wizard_block import _VALID_BLOCK_TYPES
 from common.utils.logging_setup import logger
 
 class CodeTemplate(BaseEntity):
@@ -16,8 +17,10 @@ class CodeTemplate(BaseEntity):
     template: str
     block_type: str
     isactive: bool
+    # Field values live in slots; BaseEntity still provides __dict__ for its internal attributes
+    __slots__ = ('template', 'block_type')
 
-    def __init__(self, name: str, template: str, block_type: str, isactive: bool = True, use_cache: bool = False):
+    def __init__(self, name: str, template: str, block_type: str, isactive: bool = True, use_cache: bool = True):
         """Initialize a CodeTemplate with specified attributes.
 
         Args:
@@ -25,12 +28,12 @@ class CodeTemplate(BaseEntity):
             template (str): Template content.
             block_type (str): Type of block the template applies to.
             isactive (bool): Activation status. Defaults to True.
-            use_cache (bool): Enable caching for serialization. Defaults to False.
+            use_cache (bool): Enable caching for serialization. Defaults to True.
 
         Raises:
             ValueError: If block_type is invalid or template is empty.
         """
-        if block_type not in ("entity", "container", "operation", "project"):
+        if block_type not in _VALID_BLOCK_TYPES:
             raise ValueError(f"Invalid block_type: {block_type}")
         if not template:
             raise ValueError(f"Template content cannot be empty")
@@ -41,4 +44,4 @@ class CodeTemplate(BaseEntity):
             isactive=isactive,
             use_cache=use_cache
         )
-        logger.info(f"Initialized CodeTemplate '{name}' for block_type '{block_type}'")
\ No newline at end of file
+        logger.info("Initialized CodeTemplate '%s' for block_type '%s'", name, block_type)
\ No newline at end of file
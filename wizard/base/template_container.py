@@ -1,9 +1,49 @@
 # wizard/base/template_container.py
-from typing import Dict, Optional
+import hashlib
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from jinja2 import Environment, FileSystemBytecodeCache, FunctionLoader, Template, TemplateSyntaxError
 from common.base.basecontainer import BaseContainer
 from wizard.base.code_template import CodeTemplate
 from common.utils.logging_setup import logger
 
+# Sources being compiled, keyed by their SHA-1; only populated while compile_template loads a template
+_PENDING_SOURCES: Dict[str, str] = {}
+
+# Shared environment for all template containers; block tags strip their own line whitespace.
+# Templates are loaded by source hash rather than with from_string so that Jinja consults the
+# bytecode cache, which keeps compiled templates on disk (in the system temp directory) across runs.
+_JINJA_ENV = Environment(
+    loader=FunctionLoader(_PENDING_SOURCES.get),
+    bytecode_cache=FileSystemBytecodeCache(),
+    cache_size=128,
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=False
+)
+
+
+@lru_cache(maxsize=128)
+def compile_template(source: str) -> Template:
+    """Compile a template source with the shared Jinja2 environment.
+
+    Args:
+        source (str): Jinja2 template source.
+
+    Returns:
+        Template: The compiled template, reused for identical sources.
+
+    Raises:
+        TemplateSyntaxError: If the source is not a valid Jinja2 template.
+    """
+    name = hashlib.sha1(source.encode("utf-8")).hexdigest()
+    _PENDING_SOURCES[name] = source
+    try:
+        return _JINJA_ENV.get_template(name)
+    finally:
+        del _PENDING_SOURCES[name]
+
 class TemplateContainer(BaseContainer[CodeTemplate]):
     """Container for storing CodeTemplate instances in MSBWizard.
 
@@ -14,6 +54,7 @@ class TemplateContainer(BaseContainer[CodeTemplate]):
         _items (Dict[str, CodeTemplate]): Dictionary of templates indexed by name.
         isactive (bool): Activation status of the container.
         _use_cache (bool): Cache flag for serialization.
+        _compiled (Dict[str, Tuple[str, Template]]): Compiled templates with the source they were built from.
     """
     name: str
     _items: Dict[str, CodeTemplate]
@@ -34,8 +75,9 @@ class TemplateContainer(BaseContainer[CodeTemplate]):
             TypeError: If items or their values do not match CodeTemplate type.
             ValueError: If template names do not match dictionary keys.
         """
+        self._compiled: Dict[str, Tuple[str, Template]] = {}
         super().__init__(items=items, name=name, isactive=isactive, use_cache=use_cache)
-        logger.info(f"Initialized TemplateContainer '{name}' with {len(self._items)} templates")
+        logger.info("Initialized TemplateContainer '%s' with %d templates", name, len(self._items))
 
     def _validate_item(self, item: CodeTemplate) -> None:
         """Validate a CodeTemplate item.
@@ -51,4 +93,37 @@ class TemplateContainer(BaseContainer[CodeTemplate]):
             raise TypeError(f"Item must be CodeTemplate, got {type(item).__name__}")
         if not item.template:
             raise ValueError(f"Template '{item.name}' has empty content")
-        logger.debug(f"Validated CodeTemplate '{item.name}'")
\ No newline at end of file
+        logger.debug("Validated CodeTemplate '%s'", item.name)
+
+    def _invalidate_cache(self) -> None:
+        """Invalidate the serialization cache and drop compiled templates."""
+        super()._invalidate_cache()
+        self._compiled.clear()
+
+    def compile_all(self) -> None:
+        """Compile every template in the container, logging templates that fail to compile."""
+        for name in self._items:
+            try:
+                self.get_compiled(name)
+            except TemplateSyntaxError as e:
+                logger.warning("Failed to compile template '%s': %s", name, e)
+
+    def get_compiled(self, name: str) -> Optional[Template]:
+        """Return the compiled Jinja2 template for a template name.
+
+        Templates are recompiled when their source has changed since the last compilation.
+
+        Args:
+            name (str): The template name.
+
+        Returns:
+            Optional[Template]: The compiled template, or None if no template has that name.
+        """
+        template = self._items.get(name)
+        if template is None:
+            return None
+        source = template.template
+        entry = self._compiled.get(name)
+        if entry is None or entry[0] != source:
+            entry = self._compiled[name] = (source, compile_template(source))
+        return entry[1]
@@ -3,6 +3,8 @@ from typing import Dict, Any, List, Tuple
 from common.base.baseentity import BaseEntity
 from common.utils.logging_setup import logger
 
+_VALID_BLOCK_TYPES = frozenset(("entity", "container", "operation", "project"))
+
 class WizardBlock(BaseEntity):
     """Base entity representing a visual block in MSBWizard.
 
@@ -20,12 +22,14 @@ class WizardBlock(BaseEntity):
     position: Tuple[int, int]
     connections: List[str]
     isactive: bool
+    # Field values live in slots; BaseEntity still provides __dict__ for its internal attributes
+    __slots__ = ('block_type', 'attributes', 'position', 'connections')
 
     def __init__(self, name: str, block_type: str, attributes: Dict[str, Any] = None,
                  position: Tuple[int, int] = (0, 0), connections: List[str] = None,
-                 isactive: bool = True, use_cache: bool = False):
+                 isactive: bool = True, use_cache: bool = True):
         """Initialize a WizardBlock with specified attributes."""
-        if block_type not in ("entity", "container", "operation", "project"):
+        if block_type not in _VALID_BLOCK_TYPES:
             raise ValueError(f"Invalid block_type: {block_type}")
         super().__init__(
             name=name,
@@ -36,4 +40,15 @@ class WizardBlock(BaseEntity):
             connections=connections or [],
             use_cache=use_cache
         )
-        logger.info(f"Initialized WizardBlock '{name}' of type '{block_type}'")
\ No newline at end of file
+        logger.info("Initialized WizardBlock '%s' of type '%s'", name, block_type)
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'WizardBlock':
+        """Create a WizardBlock from a dictionary.
+
+        JSON has no tuple type, so a position read back from a saved project arrives as a list
+        and is converted to a tuple here.
+        """
+        position = data.get("position")
+        if isinstance(position, list):
+            data = {**data, "position": tuple(position)}
+        return super().from_dict(data)
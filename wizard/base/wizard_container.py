@@ -2,7 +2,6 @@
 from typing import Dict, Optional
 from common.base.basecontainer import BaseContainer
 from wizard.base.wizard_block import WizardBlock
-from common.utils.logging_setup import logger
 
 class WizardContainer(BaseContainer[WizardBlock]):
     """Container for storing WizardBlock instances in MSBWizard.
@@ -17,6 +16,8 @@ class WizardContainer(BaseContainer[WizardBlock]):
     _items: Dict[str, WizardBlock]
     isactive: bool
     _use_cache: bool
+    # Item storage lives in slots; BaseContainer still provides __dict__ for its other attributes
+    __slots__ = ('_items', '_item_type')
 
     def __init__(self, items: Dict[str, WizardBlock] = None, name: str = None,
                  isactive: bool = True, use_cache: bool = False):
@@ -25,6 +26,28 @@ class WizardContainer(BaseContainer[WizardBlock]):
 
     def _validate_item(self, item: WizardBlock) -> None:
         """Validate a WizardBlock item."""
-        if not isinstance(item, WizardBlock):
+        # Exact-type identity check first; isinstance only for subclasses
+        if type(item) is not WizardBlock and not isinstance(item, WizardBlock):
             raise TypeError(f"Item must be WizardBlock, got {type(item).__name__}")
-        logger.debug(f"Validated WizardBlock '{item.name}'")
\ No newline at end of file
+
+    def bulk_add(self, items: Dict[str, WizardBlock], validate: bool = False) -> None:
+        """Add many blocks at once.
+
+        Args:
+            items (Dict[str, WizardBlock]): Blocks indexed by name.
+            validate (bool): Validate keys, types and duplicates of each block. Defaults to False,
+                for trusted input such as blocks just rebuilt by WizardBlock.from_dict.
+
+        Raises:
+            TypeError: If validate is True and an item is not a WizardBlock.
+            ValueError: If validate is True and a name does not match its key or already exists.
+        """
+        if validate:
+            for key, item in items.items():
+                self._validate_item(item)
+                if item.name != key:
+                    raise ValueError(f"Item name '{item.name}' does not match key '{key}'")
+                if key in self._items:
+                    raise ValueError(f"Item with name '{key}' already exists in {self.__class__.__name__}")
+        self._items.update(items)
+        self._invalidate_cache()
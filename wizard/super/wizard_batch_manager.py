@@ -0,0 +1,102 @@
+# wizard/super/wizard_batch_manager.py
+from typing import Dict, Any, List, Optional
+from common.super.super import Super
+from common.super.manipulator import Manipulator
+from wizard.super.wizard_project import WizardProject
+from wizard.base.wizard_block import WizardBlock
+from common.utils.logging_setup import logger
+
+def _response_error(response: Dict[str, Any]) -> Optional[str]:
+    """Return the error of a failed response, including failures reported in a nested handler response.
+
+    Args:
+        response (Dict[str, Any]): Response of a Manipulator request or a handler's execute.
+
+    Returns:
+        Optional[str]: The error message, or None if the request succeeded.
+    """
+    if not response["status"]:
+        return response.get("error", "Unknown error")
+    nested = response["result"]
+    if isinstance(nested, dict) and nested.get("status") is False:
+        return nested.get("error", "Unknown error")
+    return None
+
+class BatchManager(Super):
+    """Super-class for managing and rendering batches of WizardBlocks in MSBWizard.
+
+    Creates and renders a batch of blocks in a single pass: the "manage" and "render" handlers of the
+    associated Manipulator are looked up once and executed directly for every block, so the batch costs
+    one request dispatch instead of one per block and operation.
+
+    Attributes:
+        _manipulator (Manipulator): Associated Manipulator instance.
+        _methods (Dict[Type, Dict[str, Callable]]): Method registry for batch operations.
+        _operation (str): Operation name ("manage_and_render").
+    """
+    _operation: str = "manage_and_render"
+
+    def __init__(self, manipulator: Manipulator = None):
+        """Initialize the BatchManager.
+
+        Args:
+            manipulator (Manipulator, optional): The Manipulator instance. Defaults to None.
+        """
+        super().__init__(manipulator=manipulator)
+        logger.info("Initialized BatchManager")
+
+    def _manage_and_render_wizardproject(self, obj: WizardProject, attributes: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Manage and render a batch of blocks of a project.
+
+        Args:
+            obj (WizardProject): The project the blocks belong to.
+            attributes (Dict[str, Any], optional): Batch attributes: "blocks" (list of WizardBlock), an optional
+                "manage" dict (e.g. {"action": "create"}) and a "render" dict (defaults to {"action": "add"}).
+                When "manage" is omitted the blocks are only rendered.
+
+        Returns:
+            List[Dict[str, Any]]: Per-block responses of the last operation run on each block.
+
+        Raises:
+            ValueError: If "blocks" is not a list of WizardBlock, a required operation is not registered,
+                or any block failed to be managed or rendered.
+        """
+        if attributes is None:
+            attributes = {}
+        blocks = attributes.get("blocks")
+        if not isinstance(blocks, (list, tuple)):
+            raise ValueError(f"Invalid 'blocks' type: expected list, got {type(blocks).__name__}")
+
+        manage_attributes = attributes.get("manage")
+        render_attributes = attributes.get("render") or {"action": "add"}
+        manager = None
+        if manage_attributes is not None:
+            manager = self._manipulator.get_operation("manage")
+            if manager is None:
+                raise ValueError("Operation 'manage' not registered")
+        renderer = self._manipulator.get_operation("render")
+        if renderer is None:
+            raise ValueError("Operation 'render' not registered")
+
+        results = []
+        errors = []
+        for block in blocks:
+            if not isinstance(block, WizardBlock):
+                raise ValueError(f"Invalid block type: expected WizardBlock, got {type(block).__name__}")
+            if manager is not None:
+                response = manager.execute(block, manage_attributes)
+                error = _response_error(response)
+                if error is not None:
+                    results.append(response)
+                    errors.append(error)
+                    continue
+            response = renderer.execute(block, render_attributes)
+            results.append(response)
+            error = _response_error(response)
+            if error is not None:
+                errors.append(error)
+
+        logger.info(f"Processed manage_and_render for {len(blocks)} blocks with {len(errors)} errors")
+        if errors:
+            raise ValueError("; ".join(errors))
+        return results
@@ -1,11 +1,63 @@
 # wizard/super/wizard_generator.py
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+from jinja2 import Template
 from common.super.super import Super
 from common.super.manipulator import Manipulator
 from wizard.super.wizard_project import WizardProject
 from wizard.base.wizard_block import WizardBlock
 from common.utils.logging_setup import logger
-from jinja2 import Template
+
+def _block_context(block: WizardBlock) -> Mapping[str, Any]:
+    """Build the read-only template context entry for a block.
+
+    Args:
+        block (WizardBlock): The block to describe.
+
+    Returns:
+        Mapping[str, Any]: Block name, type, position, connections and user-defined attributes.
+    """
+    return MappingProxyType({
+        "name": block.name,
+        "block_type": block.block_type,
+        "position": tuple(block.position),
+        "connections": tuple(block.connections),
+        "attributes": MappingProxyType(dict(block.attributes))
+    })
+
+def project_context(project: WizardProject) -> Mapping[str, Any]:
+    """Build the read-only template context of a project.
+
+    The context holds only what the project templates read and copies every mutable container, so it
+    can be rendered on a worker thread while the project is edited on the GUI thread.
+
+    Args:
+        project (WizardProject): The project to describe.
+
+    Returns:
+        Mapping[str, Any]: Project name, block contexts and connections.
+    """
+    return MappingProxyType({
+        "project_name": project.name,
+        "blocks": tuple(_block_context(block) for block in project.blocks.get_all().values()),
+        "connections": MappingProxyType({source: tuple(targets) for source, targets in project.connections.items()})
+    })
+
+def render_template(jinja_template: Template, target_path: Optional[str] = None, **context: Any) -> str:
+    """Render a compiled template from its output stream.
+
+    Args:
+        jinja_template (Template): The compiled template.
+        target_path (str, optional): File to stream the output to. Defaults to None.
+        **context: Template context.
+
+    Returns:
+        str: The rendered code, or target_path when the output was streamed to a file.
+    """
+    if target_path:
+        jinja_template.stream(**context).dump(target_path, encoding="utf-8")
+        return target_path
+    return "".join(jinja_template.generate(**context))
 
 class CodeGenerator(Super):
     """Super-class for generating Python code from MSBWizard configurations using Jinja2."""
@@ -16,57 +68,50 @@ class CodeGenerator(Super):
         logger.info("Initialized CodeGenerator")
 
     def _generate_wizardproject(self, obj: WizardProject, attributes: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Generate Python code for a WizardProject, creating custom classes for each block."""
+        """Generate Python code for a WizardProject, creating custom classes for each block.
+
+        If attributes contain "target_path", the code is streamed to that file and the path is returned.
+        """
         if attributes is None:
             attributes = {}
         template_name = attributes.get("template", "default_project_template")
-        template = obj.templates.get(template_name)
-        if not template:
-            logger.error(f"Template '{template_name}' not found")
-            return self._build_response(obj, False, "_generate_wizardproject", None, f"Template '{template_name}' not found")
-
         try:
-            jinja_template = Template(template.template)
-            code = jinja_template.render(
-                project_name=obj.name,
-                blocks=[{
-                    "name": block.name,
-                    "base_class": block.base_class,
-                    "block_type": block.block_type,
-                    "position": block.position,
-                    "connections": block.connections,
-                    "attributes": block.to_dict()  # Pass all block attributes
-                } for block in obj.blocks.get_all().values()],
-                connections=obj.connections
-            )
-            logger.info(f"Generated code for project '{obj.name}' with {len(obj.blocks.get_all())} classes")
+            jinja_template = obj.get_compiled(template_name)
+            if jinja_template is None:
+                logger.error(f"Template '{template_name}' not found")
+                return self._build_response(obj, False, "_generate_wizardproject", None, f"Template '{template_name}' not found")
+            context = project_context(obj)
+            code = render_template(jinja_template, attributes.get("target_path"), **context)
+            logger.info("Generated code for project '%s' with %d classes", obj.name, len(context["blocks"]))
             return self._build_response(obj, True, "_generate_wizardproject", code)
         except Exception as e:
             logger.error(f"Failed to render template '{template_name}': {str(e)}")
             return self._build_response(obj, False, "_generate_wizardproject", None, str(e))
 
     def _generate_wizardblock(self, obj: WizardBlock, attributes: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Generate Python code for a single WizardBlock as a custom class."""
+        """Generate Python code for a single WizardBlock as a custom class.
+
+        If attributes contain "target_path", the code is streamed to that file and the path is returned.
+        """
         if attributes is None:
             attributes = {}
         template_name = attributes.get("template", f"{obj.block_type}_template")
         project = self._manipulator.get_managing_object()
-        template = project.templates.get(template_name) if isinstance(project, WizardProject) else None
-        if not template:
-            logger.error(f"Template '{template_name}' not found")
-            return self._build_response(obj, False, "_generate_wizardblock", None, f"Template '{template_name}' not found")
-
         try:
-            jinja_template = Template(template.template)
-            code = jinja_template.render(
+            jinja_template = project.get_compiled(template_name) if isinstance(project, WizardProject) else None
+            if jinja_template is None:
+                logger.error(f"Template '{template_name}' not found")
+                return self._build_response(obj, False, "_generate_wizardblock", None, f"Template '{template_name}' not found")
+            code = render_template(
+                jinja_template,
+                attributes.get("target_path"),
                 block_name=obj.name,
-                base_class=obj.base_class,
                 block_type=obj.block_type,
                 position=obj.position,
                 connections=obj.connections,
                 attributes=obj.to_dict()
             )
-            logger.info(f"Generated code for block '{obj.name}' as class '{obj.name}({obj.base_class})'")
+            logger.info("Generated code for block '%s' as class '%s'", obj.name, obj.name)
             return self._build_response(obj, True, "_generate_wizardblock", code)
         except Exception as e:
             logger.error(f"Failed to render template '{template_name}': {str(e)}")
@@ -98,22 +98,22 @@ class BlockManager(Super):
 
         try:
             if action == "connect":
-                if source not in obj.blocks:
+                source_block = obj.blocks.get_all().get(source)
+                if source_block is None:
                     return self._build_response(obj, False, "_manage_connections", None, f"Source block '{source}' not found")
                 if target not in obj.blocks:
                     return self._build_response(obj, False, "_manage_connections", None, f"Target block '{target}' not found")
-                if source not in obj.connections:
-                    obj.connections[source] = []
-                if target not in obj.connections[source]:
-                    obj.connections[source].append(target)
-                    obj.blocks[source].connections.append(target)
+                if obj.add_connection(source, target):
+                    source_block.connections.append(target)
+                    source_block._invalidate_cache()
                     logger.info(f"Connected block '{source}' to '{target}'")
                 return self._build_response(obj, True, "_manage_connections", obj.connections)
             elif action == "disconnect":
-                if source not in obj.connections or target not in obj.connections[source]:
+                if not obj.remove_connection(source, target):
                     return self._build_response(obj, False, "_manage_connections", None, f"No connection between '{source}' and '{target}'")
-                obj.connections[source].remove(target)
-                obj.blocks[source].connections.remove(target)
+                source_block = obj.blocks.get_all()[source]
+                source_block.connections.remove(target)
+                source_block._invalidate_cache()
                 logger.info(f"Disconnected block '{source}' from '{target}'")
                 return self._build_response(obj, True, "_manage_connections", obj.connections)
             else:
@@ -8,6 +8,7 @@ from wizard.super.wizard_project import WizardProject
 from wizard.super.wizard_generator import CodeGenerator
 from wizard.super.wizard_manager import BlockManager
 from wizard.super.wizard_ui_manager import UIManager
+from wizard.super.wizard_batch_manager import BatchManager
 from common.utils.logging_setup import logger
 from PySide6.QtWidgets import QGraphicsScene
 
@@ -26,4 +27,5 @@ class WizardManipulator(Manipulator):
         self.register_operation("manage", BlockManager(manipulator=self))
         self.register_operation("generate", CodeGenerator(manipulator=self))
         self.register_operation("render", UIManager(manipulator=self, scene=scene))
-        logger.info("Initialized WizardManipulator")
\ No newline at end of file
+        self.register_operation("manage_and_render", BatchManager(manipulator=self))
+        logger.info("Initialized WizardManipulator")
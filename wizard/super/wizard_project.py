@@ -1,5 +1,6 @@
 # wizard/super/wizard_project.py
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
+from jinja2 import Template
 from common.super.project import Project
 from wizard.base.wizard_block import WizardBlock
 from wizard.base.code_template import CodeTemplate
@@ -8,6 +9,16 @@ from wizard.base.template_container import TemplateContainer
 from common.utils.validation import check_non_empty_string
 from common.utils.logging_setup import logger
 
+def _container_items(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the item dicts of a serialized container.
+
+    Accepts both a container's to_dict output ({"name", "isactive", "type", "items"}) and a plain
+    name -> item mapping.
+    """
+    if "type" in data and isinstance(data.get("items"), dict):
+        return data["items"]
+    return data
+
 class WizardProject(Project):
     """Project class for managing MSBWizard configurations.
 
@@ -30,43 +41,120 @@ class WizardProject(Project):
         super().__init__(name=name)
         self.blocks = WizardContainer(items=blocks, name=f"{name}_blocks")
 
-        default_template = CodeTemplate(
+        if not templates:
+            templates = {"default_project_template": self._default_template()}
+        self.templates = TemplateContainer(items=templates, name=f"{name}_templates")
+        self.templates.compile_all()
+        self.connections = connections or {}
+        # Set-backed mirror of connections for O(1) membership tests; mutate through add/remove_connection
+        self._conn_index: Dict[str, Set[str]] = {source: set(targets) for source, targets in self.connections.items()}
+        # Reverse index: target block name -> names of blocks connected to it
+        self._incoming: Dict[str, Set[str]] = {}
+        for source, targets in self.connections.items():
+            for target in targets:
+                self._incoming.setdefault(target, set()).add(source)
+        logger.info(f"Initialized WizardProject '{name}' with {len(self.blocks)} blocks and {len(self.templates)} templates")
+
+    @staticmethod
+    def _default_template() -> CodeTemplate:
+        """Create the default project template."""
+        return CodeTemplate(
             name="default_project_template",
-            template="""# Generated MSB Project: {{project_name}}
+            template="""# Generated MSB Project: {{ project_name }}
 from common.base.baseentity import BaseEntity
 from common.base.basecontainer import BaseContainer
+{% for block in blocks %}
 
-{% for name, block in blocks.items() %}
-class {{block.type | capitalize}}(BaseEntity):
+class {{ block.name }}(BaseEntity):
     name: str
-    {% for attr_name, attr_value in block.attributes.items() %}
-    {{attr_name}}: {{attr_value.__class__.__name__}}
-    {% endfor %}
+{% for attr_name, attr_value in block.attributes.items() %}
+    {{ attr_name ~ ": " ~ attr_value.__class__.__name__ }}
+{% endfor %}
 {% endfor %}
 """,
             block_type="project"
         )
-        templates = templates or {"default_project_template": default_template}
-        self.templates = TemplateContainer(items=templates, name=f"{name}_templates")
-        self.connections = connections or {}
-        logger.info(f"Initialized WizardProject '{name}' with {len(self.blocks)} blocks and {len(self.templates)} templates")
 
     def create_item(self, item_code: str = "BLOCK_DEFAULT", isactive: bool = True) -> None:
         """Create and add a new WizardBlock to the project."""
         block = WizardBlock(name=item_code, block_type="entity", isactive=isactive)
         self.add_item(block)
 
+    def add_connection(self, source: str, target: str) -> bool:
+        """Add a connection from source to target.
+
+        Args:
+            source (str): Name of the source block.
+            target (str): Name of the target block.
+
+        Returns:
+            bool: True if the connection was added, False if it already existed.
+        """
+        targets = self._conn_index.setdefault(source, set())
+        if target in targets:
+            return False
+        targets.add(target)
+        self.connections.setdefault(source, []).append(target)
+        self._incoming.setdefault(target, set()).add(source)
+        return True
+
+    def remove_connection(self, source: str, target: str) -> bool:
+        """Remove the connection from source to target.
+
+        Args:
+            source (str): Name of the source block.
+            target (str): Name of the target block.
+
+        Returns:
+            bool: True if the connection was removed, False if it did not exist.
+        """
+        targets = self._conn_index.get(source)
+        if targets is None or target not in targets:
+            return False
+        targets.discard(target)
+        self.connections[source].remove(target)
+        sources = self._incoming.get(target)
+        if sources is not None:
+            sources.discard(source)
+        return True
+
+    def get_incoming(self, target: str) -> Set[str]:
+        """Return the names of blocks connected to the target block.
+
+        Args:
+            target (str): Name of the target block.
+
+        Returns:
+            Set[str]: Source block names; empty if the block has no incoming connections.
+        """
+        return self._incoming.get(target, set())
+
+    def get_compiled(self, name: str) -> Optional[Template]:
+        """Return the compiled Jinja2 template for a project template name.
+
+        Args:
+            name (str): The template name.
+
+        Returns:
+            Optional[Template]: The compiled template, or None if the template does not exist.
+        """
+        return self.templates.get_compiled(name)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'WizardProject':
         """Create a WizardProject from a dictionary."""
-        blocks = {k: WizardBlock.from_dict(v) for k, v in data.get("blocks", {}).items()}
-        templates = {k: CodeTemplate.from_dict(v) for k, v in data.get("templates", {}).items()}
-        return cls(
+        block_from_dict = WizardBlock.from_dict
+        template_from_dict = CodeTemplate.from_dict
+        blocks = {k: block_from_dict(v) for k, v in _container_items(data.get("blocks", {})).items()}
+        templates = {k: template_from_dict(v) for k, v in _container_items(data.get("templates", {})).items()}
+        project = cls(
             name=data.get("name", "WIZARD_PROJECT"),
-            blocks=blocks,
-            templates=templates,
+            templates=templates or None,
             connections=data.get("connections", {})
         )
+        # Blocks were just rebuilt from their own dicts, so skip per-item container validation
+        project.blocks.bulk_add(blocks, validate=False)
+        return project
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the project to a dictionary."""
@@ -1,4 +1,5 @@
 # wizard/super/wizard_ui_manager.py
+import logging
 from typing import Dict, Any, Optional, Tuple
 from common.super.super import Super
 from common.super.manipulator import Manipulator
@@ -7,7 +8,7 @@ from wizard.super.wizard_project import WizardProject
 from common.utils.logging_setup import logger
 from PySide6.QtWidgets import QGraphicsScene, QGraphicsRectItem, QGraphicsTextItem, QGraphicsLineItem
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QBrush, QColor, QFont
+from PySide6.QtGui import QBrush, QColor, QFont, QFontMetricsF, QTextDocument
 
 class UIManager(Super):
     """Super-class for managing PySide6-based UI rendering in MSBWizard.
@@ -20,66 +21,150 @@ class UIManager(Super):
         _operation (str): Operation name ("render").
         _scene (QGraphicsScene): PySide6 graphics scene for rendering blocks.
         _block_items (Dict[str, QGraphicsRectItem]): Mapping of block names to their rendered items.
+        _text_items (Dict[str, QGraphicsTextItem]): Mapping of block names to the label items of their rendered blocks.
         _connection_lines (Dict[Tuple[str, str], QGraphicsLineItem]): Mapping of (source, target) to connection lines.
+        _block_centers (Dict[str, QPointF]): Cached scene-coordinate centers of rendered blocks, used as line endpoints.
     """
     _operation: str = "render"
+    # Shared block brush and font, created on first instantiation once a QApplication exists
+    _BLOCK_BRUSH: Optional[QBrush] = None
+    _BLOCK_FONT: Optional[QFont] = None
 
     def __init__(self, manipulator: Manipulator = None, scene: QGraphicsScene = None):
         """Initialize the UIManager."""
         super().__init__(manipulator=manipulator)
         if scene is None:
             raise ValueError("QGraphicsScene must be provided")
+        if UIManager._BLOCK_BRUSH is None:
+            UIManager._BLOCK_BRUSH = QBrush(QColor(200, 200, 255))
+            UIManager._BLOCK_FONT = QFont("Arial", 10)
         self._scene = scene
         self._block_items = {}
+        self._text_items = {}
         self._connection_lines = {}
-        logger.info(f"Initialized UIManager with scene ID: {id(self._scene)}")
+        self._block_centers = {}
+        # Label sizes measured once per block name, matching QGraphicsTextItem.boundingRect() (text plus document margins)
+        self._font_metrics = QFontMetricsF(self._BLOCK_FONT)
+        self._text_margin = QTextDocument().documentMargin()
+        self._text_size_cache: Dict[str, Tuple[float, float]] = {}
+        logger.info("Initialized UIManager with scene ID: %s", id(self._scene))
     
     def _render_wizardproject(self, obj: WizardProject, attributes: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Render or refresh all WizardBlocks and connections in a WizardProject on the PySide6 canvas."""
+        """Render or refresh all WizardBlocks and connections in a WizardProject on the PySide6 canvas.
+
+        Items of blocks that are already rendered are updated in place; only new blocks and connections
+        allocate items, and items of removed blocks and connections are dropped from the scene.
+        """
         if attributes is None:
             attributes = {}
+        # Batch the refresh: no per-item BSP reinsertion or change signals until all items are updated.
+        # NoIndex is fine while the scene is being populated; the previous index method (e.g. BspTreeIndex
+        # for interactive hit-testing) is restored afterwards.
+        old_index_method = self._scene.itemIndexMethod()
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self._scene.blockSignals(True)
         try:
-            self._scene.clear()
-            self._block_items.clear()
-            self._connection_lines.clear()
-
             width = attributes.get("width", 100)
             height = attributes.get("height", 50)
-            for block in obj.blocks.get_all().values():
+            blocks = obj.blocks.get_all()
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+            # Drop items of blocks that no longer exist
+            for name in self._block_items.keys() - blocks.keys():
+                self._scene.removeItem(self._block_items.pop(name))
+                self._text_items.pop(name, None)
+                self._block_centers.pop(name, None)
+
+            for block in blocks.values():
                 x, y = block.position
+                block_item = self._block_items.get(block.name)
+                if block_item is not None:
+                    # Reuse the existing item, only refreshing its geometry and tooltip
+                    block_item.setPos(0, 0)
+                    block_item.setRect(x, y, width, height)
+                    block_item.setToolTip(f"{block.name} ({block.block_type})")
+                    text_width, text_height = self._text_size(block.name)
+                    self._text_items[block.name].setPos((width - text_width) / 2, (height - text_height) / 2)
+                    self._block_centers[block.name] = block_item.sceneBoundingRect().center()
+                    logger.debug("Project block '%s' updated: pos=(%s, %s), size=%sx%s", block.name, x, y, width, height)
+                    continue
                 block_item = QGraphicsRectItem(x, y, width, height)
                 block_item.setFlag(QGraphicsRectItem.ItemIsMovable, True)
                 block_item.setToolTip(f"{block.name} ({block.block_type})")
                 # Add background color for visibility
-                block_item.setBrush(QBrush(QColor(200, 200, 255)))
+                block_item.setBrush(self._BLOCK_BRUSH)
                 text_item = QGraphicsTextItem(block.name, block_item)
-                text_item.setFont(QFont("Arial", 10))
-                text_rect = text_item.boundingRect()
-                text_x = (width - text_rect.width()) / 2
-                text_y = (height - text_rect.height()) / 2
+                text_item.setFont(self._BLOCK_FONT)
+                text_width, text_height = self._text_size(block.name)
+                text_x = (width - text_width) / 2
+                text_y = (height - text_height) / 2
                 text_item.setPos(text_x, text_y)
-                logger.debug(f"Project block '{block.name}': pos=({x}, {y}), size={width}x{height}, text_rect={text_rect.width()}x{text_rect.height()}, text_pos=({text_x}, {text_y})")
+                if debug_enabled:
+                    logger.debug("Project block '%s': pos=(%s, %s), size=%sx%s, text_rect=%sx%s, text_pos=(%s, %s)",
+                                 block.name, x, y, width, height, text_width, text_height, text_x, text_y)
                 self._scene.addItem(block_item)
                 self._block_items[block.name] = block_item
+                self._text_items[block.name] = text_item
+                self._block_centers[block.name] = block_item.sceneBoundingRect().center()
 
-            for source, targets in obj.connections.items():
-                for target in targets:
-                    if source in self._block_items and target in self._block_items:
-                        self._render_connection(source, target)
+            block_items = self._block_items
+            wanted_connections = {
+                (source, target)
+                for source, targets in obj.connections.items() if source in block_items
+                for target in targets if target in block_items
+            }
+            for key in self._connection_lines.keys() - wanted_connections:
+                self._scene.removeItem(self._connection_lines.pop(key))
+            for source, target in wanted_connections:
+                line = self._connection_lines.get((source, target))
+                if line is None:
+                    self._render_connection(source, target)
+                else:
+                    source_center = self._block_centers[source]
+                    target_center = self._block_centers[target]
+                    line.setLine(source_center.x(), source_center.y(), target_center.x(), target_center.y())
 
-            logger.info(f"Rendered WizardProject '{obj.name}' with {len(self._block_items)} blocks")
-            self._scene.update()
+            logger.info("Rendered WizardProject '%s' with %d blocks", obj.name, len(self._block_items))
             return self._build_response(obj, True, "_render_wizardproject", None)
         except Exception as e:
             logger.error(f"Failed to render WizardProject '{obj.name}': {str(e)}")
             return self._build_response(obj, False, "_render_wizardproject", None, str(e))
+        finally:
+            self._scene.blockSignals(False)
+            self._scene.setItemIndexMethod(old_index_method)
+            self._scene.update()
+
+    def _managing_project(self) -> Optional[WizardProject]:
+        """Return the project managed by the associated Manipulator, or None if there is none."""
+        if self._manipulator is None:
+            return None
+        project = self._manipulator.get_managing_object()
+        return project if isinstance(project, WizardProject) else None
+
+    def _text_size(self, text: str) -> Tuple[float, float]:
+        """Return the size of a block label, measuring it on first use.
+
+        Args:
+            text (str): The label text (block name).
+
+        Returns:
+            Tuple[float, float]: Width and height of the label item.
+        """
+        size = self._text_size_cache.get(text)
+        if size is None:
+            margin = 2 * self._text_margin
+            size = self._text_size_cache[text] = (
+                self._font_metrics.horizontalAdvance(text) + margin,
+                self._font_metrics.height() + margin
+            )
+        return size
 
     def _render_wizardblock(self, obj: WizardBlock, attributes: Dict[str, Any] = None) -> Dict[str, Any]:
         """Render a WizardBlock on the PySide6 canvas, handling add, remove, or refresh actions."""
         if attributes is None:
             attributes = {}
         action = attributes.get("action", "add")
-        logger.debug(f"Processing render action '{action}' for WizardBlock '{obj.name}'")
+        logger.debug("Processing render action '%s' for WizardBlock '%s'", action, obj.name)
 
         try:
             if action == "add":
@@ -104,34 +189,40 @@ class UIManager(Super):
 
         try:
             # Remove existing block to prevent duplication
-            if obj.name in self._block_items:
-                logger.debug(f"Block '{obj.name}' already exists in _block_items, removing before re-rendering")
-                self._scene.removeItem(self._block_items[obj.name])
-                del self._block_items[obj.name]
+            existing_item = self._block_items.pop(obj.name, None)
+            if existing_item is not None:
+                logger.debug("Block '%s' already exists in _block_items, removing before re-rendering", obj.name)
+                self._scene.removeItem(existing_item)
+                self._text_items.pop(obj.name, None)
+                self._block_centers.pop(obj.name, None)
 
             x, y = obj.position
             block_item = QGraphicsRectItem(x, y, width, height)
             block_item.setFlag(QGraphicsRectItem.ItemIsMovable, True)
             block_item.setToolTip(f"{obj.name} ({obj.block_type})")
             # Add background color for visibility
-            block_item.setBrush(QBrush(QColor(200, 200, 255)))
+            block_item.setBrush(self._BLOCK_BRUSH)
             text_item = QGraphicsTextItem(obj.name, block_item)
-            text_item.setFont(QFont("Arial", 10))
-            text_rect = text_item.boundingRect()
-            text_x = (width - text_rect.width()) / 2
-            text_y = (height - text_rect.height()) / 2
+            text_item.setFont(self._BLOCK_FONT)
+            text_width, text_height = self._text_size(obj.name)
+            text_x = (width - text_width) / 2
+            text_y = (height - text_height) / 2
             text_item.setPos(text_x, text_y)
-            logger.debug(f"Added block '{obj.name}': pos=({x}, {y}), size={width}x{height}, text_rect={text_rect.width()}x={text_rect.height()}, text_pos=({text_x}, {text_y})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Added block '%s': pos=(%s, %s), size=%sx%s, text_rect=%sx%s, text_pos=(%s, %s)",
+                             obj.name, x, y, width, height, text_width, text_height, text_x, text_y)
             self._scene.addItem(block_item)
             self._block_items[obj.name] = block_item
+            self._text_items[obj.name] = text_item
+            self._block_centers[obj.name] = block_item.sceneBoundingRect().center()
 
             # Render connections
-            project = self._get_managing_object()
-            if isinstance(project, WizardProject) and obj.name in project.connections:
-                for target in project.connections[obj.name]:
+            project = self._managing_project()
+            if project is not None:
+                for target in project.connections.get(obj.name, ()):
                     if target in self._block_items:
                         self._render_connection(obj.name, target)
-            logger.info(f"Successfully added WizardBlock '{obj.name}' at position {obj.position}")
+            logger.info("Successfully added WizardBlock '%s' at position %s", obj.name, obj.position)
             self._scene.update()
             return self._build_response(obj, True, "_add_wizardblock", block_item)
         except Exception as e:
@@ -144,23 +235,30 @@ class UIManager(Super):
             attributes = {}
         try:
             block_name = obj.name
-            if block_name not in self._block_items:
+            block_item = self._block_items.pop(block_name, None)
+            if block_item is None:
                 logger.error(f"Block '{block_name}' not found in rendered items. Available: {list(self._block_items.keys())}")
                 return self._build_response(obj, False, "_remove_wizardblock", None, f"Block '{block_name}' not rendered")
 
-            block_item = self._block_items[block_name]
             self._scene.removeItem(block_item)
-            del self._block_items[block_name]
+            self._text_items.pop(block_name, None)
+            self._block_centers.pop(block_name, None)
 
-            connections_to_remove = [
-                key for key in self._connection_lines
-                if key[0] == block_name or key[1] == block_name
-            ]
+            project = self._managing_project()
+            if project is not None:
+                connections_to_remove = [(block_name, target) for target in project.connections.get(block_name, ())]
+                connections_to_remove.extend((source, block_name) for source in project.get_incoming(block_name))
+            else:
+                connections_to_remove = [
+                    key for key in self._connection_lines
+                    if key[0] == block_name or key[1] == block_name
+                ]
             for key in connections_to_remove:
-                self._scene.removeItem(self._connection_lines[key])
-                del self._connection_lines[key]
+                line = self._connection_lines.pop(key, None)
+                if line is not None:
+                    self._scene.removeItem(line)
 
-            logger.info(f"Successfully removed WizardBlock '{block_name}' and its connections")
+            logger.info("Successfully removed WizardBlock '%s' and its connections", block_name)
             self._scene.update()
             return self._build_response(obj, True, "_remove_wizardblock", None)
         except Exception as e:
@@ -181,47 +279,58 @@ class UIManager(Super):
     def _render_connection(self, source: str, target: str) -> None:
         """Render a connection line between two blocks."""
         try:
-            source_item = self._block_items.get(source)
-            target_item = self._block_items.get(target)
-            if not source_item or not target_item:
+            source_center = self._block_centers.get(source)
+            target_center = self._block_centers.get(target)
+            if source_center is None or target_center is None:
                 logger.warning(f"Cannot render connection: block '{source}' or '{target}' not found")
                 return
-            line = QGraphicsLineItem(
-                source_item.rect().center().x(), source_item.rect().center().y(),
-                target_item.rect().center().x(), target_item.rect().center().y()
-            )
+            line = QGraphicsLineItem(source_center.x(), source_center.y(), target_center.x(), target_center.y())
             self._scene.addItem(line)
             self._connection_lines[(source, target)] = line
-            logger.debug(f"Successfully rendered connection from '{source}' to '{target}'")
+            logger.debug("Successfully rendered connection from '%s' to '%s'", source, target)
         except Exception as e:
             logger.error(f"Failed to render connection from '{source}' to '{target}': {str(e)}")
 
     def _update_position(self, obj: WizardBlock, attributes: Dict[str, Any] = None) -> Dict[str, Any]:
         """Update the position of a WizardBlock and its connections."""
-        if attributes is None or not attributes.get("position") is None:
+        new_position = (attributes or {}).get("position")
+        if new_position is None:
             logger.error("Position not provided for update")
             return self._build_response(obj, False, "_update_position", None, "Position not provided")
         try:
-            new_position = attributes["position"]
             if not isinstance(new_position, (tuple, list)) or len(new_position) != 2:
                 raise ValueError("Position must be a tuple of (x, y)")
             obj.position = new_position
-            if obj.name in self._block_items:
-                self._block_items[obj.name].setPos(new_position[0], new_position[1])
-                # Update connection lines
-                project = self._get_managing_object()
-                if isinstance(project, WizardProject):
-                    for target in project.connections.get(obj.name, []):
-                        if (obj.name, target) in self._connection_lines:
-                            self._scene.removeItem(self._connection_lines[(obj.name, target)])
-                            del self._connection_lines[(obj.name, target)]
-                            self._render_connection(obj.name, target)
-                    for source, targets in project.connections.items():
-                        if obj.name in targets and (source, obj.name) in self._connection_lines:
-                            self._scene.removeItem(self._connection_lines[(source, obj.name)])
-                            del self._connection_lines[(source, obj.name)]
-                            self._render_connection(source, obj.name)
-            logger.info(f"Successfully updated position of WizardBlock '{obj.name}' to {new_position}")
+            block_item = self._block_items.get(obj.name)
+            if block_item is not None:
+                # The rect keeps the position the item was created at; offset the item so it lands on new_position
+                rect = block_item.rect()
+                block_item.setPos(new_position[0] - rect.x(), new_position[1] - rect.y())
+                center = self._block_centers[obj.name] = block_item.sceneBoundingRect().center()
+                # Move the endpoints of existing connection lines in place
+                block_centers = self._block_centers
+                project = self._managing_project()
+                if project is not None:
+                    outgoing = [(obj.name, target) for target in project.connections.get(obj.name, ())]
+                    incoming = [(source, obj.name) for source in project.get_incoming(obj.name)]
+                else:
+                    outgoing = [key for key in self._connection_lines if key[0] == obj.name]
+                    incoming = [key for key in self._connection_lines if key[1] == obj.name]
+                for key in outgoing:
+                    line = self._connection_lines.get(key)
+                    target_center = block_centers.get(key[1])
+                    if line is not None and target_center is not None:
+                        line.setLine(center.x(), center.y(), target_center.x(), target_center.y())
+                    elif line is None:
+                        self._render_connection(*key)
+                for key in incoming:
+                    line = self._connection_lines.get(key)
+                    source_center = block_centers.get(key[0])
+                    if line is not None and source_center is not None:
+                        line.setLine(source_center.x(), source_center.y(), center.x(), center.y())
+                    elif line is None:
+                        self._render_connection(*key)
+            logger.info("Successfully updated position of WizardBlock '%s' to %s", obj.name, new_position)
             return self._build_response(obj, True, "_update_position", new_position)
         except Exception as e:
             logger.error(f"Failed to update position of WizardBlock '{obj.name}'': {str(e)}")